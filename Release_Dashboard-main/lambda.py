@@ -1,14 +1,47 @@
 import json
+import hashlib
+import os
 import urllib3
 from kubernetes import client
-import re
-from collections import defaultdict
+from kubernetes.client.rest import ApiException
+from collections import defaultdict, namedtuple, OrderedDict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, wait
+import sys
 import time
+import threading
 from datetime import datetime
 import boto3
 from botocore.exceptions import ClientError
+import base64
+import gzip
 
-VERSION_PATTERN = re.compile(r':([^:@]+)(?:@sha256:.+)?$')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import redis
+    from redis.backoff import NoBackoff
+    from redis.retry import Retry
+except ImportError:
+    redis = None
+
+IMAGE_CACHE_SIZE = int(os.environ.get("IMAGE_CACHE_SIZE", 65536))
+
+DEPLOYMENT_COLLECTION_MODE = os.environ.get("DEPLOYMENT_COLLECTION_MODE", "cluster")
+DEPLOYMENT_PAGE_SIZE = int(os.environ.get("DEPLOYMENT_PAGE_SIZE", 500))
+DEPLOYMENT_FETCH_MODE = os.environ.get("DEPLOYMENT_FETCH_MODE", "raw")
+TABLE_ACCEPT_HEADER = "application/json;as=Table;g=meta.k8s.io;v=v1"
+
+CLUSTER_FETCH_CONCURRENCY = int(os.environ.get("CLUSTER_FETCH_CONCURRENCY", 8))
+CLUSTER_FETCH_TIMEOUT = float(os.environ.get("CLUSTER_FETCH_TIMEOUT", 20))
 
 CACHE_DURATIONS = {
     "poc": 120,
@@ -17,34 +50,254 @@ CACHE_DURATIONS = {
     "prod": 120
 }
 
+DEFAULT_CACHE_DURATION = 120
+CACHE_WARM_LEAD = float(os.environ.get("CACHE_WARM_LEAD", 30))
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 500
+QUERY_CACHE_SIZE = 64
+COMPRESSION_MIN_BYTES = 1024
+
+METRICS_NAMESPACE = os.environ.get("METRICS_NAMESPACE", "ReleaseDashboard")
+METRIC_MAX_VALUES = 100
+METRIC_UNITS = {
+    "SweepLatency": "Milliseconds",
+    "SweepErrors": "Count",
+    "Deployments": "Count",
+    "Namespaces": "Count",
+    "ApiCalls": "Count",
+    "ApiErrors": "Count",
+    "ApiLatency": "Milliseconds",
+    "RefreshesInFlight": "Count",
+    "CacheHits": "Count",
+    "CacheMisses": "Count",
+    "CacheHitRatio": "Percent",
+    "SerializationTime": "Milliseconds",
+    "ResponseBytes": "Bytes"
+}
+
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", 64 * 1024 * 1024))
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+REDIS_KEY_PREFIX = os.environ.get("REDIS_KEY_PREFIX", "release-dashboard")
+REDIS_STALE_INTERVALS = int(os.environ.get("REDIS_STALE_INTERVALS", 10))
+REDIS_TIMEOUT = float(os.environ.get("REDIS_TIMEOUT", 0.5))
+
+SECRET_CACHE_TTL = int(os.environ.get("SECRET_CACHE_TTL", 300))
+SECRETS_REGION = os.environ.get("SECRETS_REGION", "ap-south-1")
+SECRETS_BATCH_SIZE = 20
+SECRETS_BATCH_ENABLED = os.environ.get("SECRETS_BATCH_ENABLED", "true").lower() == "true"
+
+CLUSTERS_SECRET_NAME = os.environ.get("CLUSTERS_SECRET_NAME")
+CLUSTER_SECRETS = json.loads(os.environ.get("CLUSTER_SECRETS", "null")) or {
+    "poc": {
+        "minikube": "cluster_creds",
+        "aks-pe-poc": "aks_creds"
+    },
+    "dev": {
+        "minikube": "cluster_creds"
+    }
+}
+
+class ImageReference(namedtuple('ImageReference', ['registry', 'repository', 'tag', 'digest'])):
+    __slots__ = ()
+
+    @property
+    def name(self):
+        if self.registry:
+            return f"{self.registry}/{self.repository}"
+        return self.repository
+
+    @property
+    def version(self):
+        if self.tag:
+            return self.tag
+        if self.digest:
+            return self.digest.split(":", 1)[-1]
+        return "None"
+
+class ContainerImage(namedtuple('ContainerImage', ['image', 'version', 'reference', 'name'], defaults=[""])):
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+    @property
+    def container(self):
+        return self.name or self.reference.name
+
+    def to_dict(self):
+        return {"image": self.image, "version": self.version}
+
+    def to_stored_dict(self):
+        return {"name": self.name, "image": self.image, "version": self.version}
+
+    def estimate_json_bytes(self):
+        return CONTAINER_JSON_OVERHEAD + len(self.image) + len(self.version)
+
+class DeploymentRecord:
+    __slots__ = ("cluster", "name", "namespace", "main_containers", "init_containers")
+
+    FIELDS = {
+        "cluster": "cluster",
+        "deployment-name": "name",
+        "namespace": "namespace",
+        "main-containers": "main_containers",
+        "init-containers": "init_containers"
+    }
+
+    def __init__(self, cluster, name, namespace, main_containers, init_containers):
+        self.cluster = sys.intern(cluster)
+        self.name = sys.intern(name)
+        self.namespace = sys.intern(namespace)
+        self.main_containers = main_containers
+        self.init_containers = init_containers
+
+    def __getitem__(self, key):
+        return getattr(self, self.FIELDS[key])
+
+    def __eq__(self, other):
+        return isinstance(other, DeploymentRecord) and all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    __hash__ = None
+
+    @classmethod
+    def from_dict(cls, info):
+        return cls(
+            info["cluster"],
+            info["deployment-name"],
+            info["namespace"],
+            get_container_images(
+                [container["image"] for container in info["main-containers"]],
+                [container.get("name", "") for container in info["main-containers"]]
+            ),
+            get_container_images(
+                [container["image"] for container in info["init-containers"]],
+                [container.get("name", "") for container in info["init-containers"]]
+            )
+        )
+
+    def to_dict(self):
+        return {
+            "cluster": self.cluster,
+            "deployment-name": self.name,
+            "namespace": self.namespace,
+            "main-containers": [container.to_dict() for container in self.main_containers],
+            "init-containers": [container.to_dict() for container in self.init_containers]
+        }
+
+    def estimate_json_bytes(self):
+        return (
+            RECORD_JSON_OVERHEAD + len(self.name) + len(self.namespace) + len(self.cluster)
+            + sum(container.estimate_json_bytes() for container in self.main_containers)
+            + sum(container.estimate_json_bytes() for container in self.init_containers)
+        )
+
+    def to_stored_dict(self):
+        return {
+            **self.to_dict(),
+            "main-containers": [container.to_stored_dict() for container in self.main_containers],
+            "init-containers": [container.to_stored_dict() for container in self.init_containers]
+        }
+
+def to_json_value(value):
+    if isinstance(value, (DeploymentRecord, ContainerImage)):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def to_stored_json_value(value):
+    if isinstance(value, (DeploymentRecord, ContainerImage)):
+        return value.to_stored_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+CONTAINER_JSON_OVERHEAD = len(json.dumps({"image": "", "version": ""})) + 2
+RECORD_JSON_OVERHEAD = len(json.dumps(DeploymentRecord("", "", "", (), ()), default=to_json_value)) + 2
+
+def estimate_result_bytes(result):
+    records = result.get('deployments') or ()
+    summary = {key: value for key, value in result.items() if key != 'deployments'}
+    return len(json.dumps(summary, default=str)) + sum(record.estimate_json_bytes() for record in records)
+
 class EnvironmentCache:
-    def __init__(self, maxsize=256):
+    def __init__(self, maxsize=256, max_bytes=None):
         self.maxsize = maxsize
-        self.cache = defaultdict(dict)
+        self.max_bytes = max_bytes
+        self.cache = defaultdict(OrderedDict)
+        self.entry_bytes = defaultdict(dict)
+        self.env_bytes = defaultdict(int)
         self.last_access_time = defaultdict(float)
+        self.refresh_locks = {}
+        self.cache_stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+        self.in_flight = defaultdict(int)
+        self.lock = threading.RLock()
 
     def get_cache_timestamp(self, env, current_time=None):
         if current_time is None:
             current_time = time.time()
         
-        if not self.last_access_time[env]:
-            self.last_access_time[env] = current_time
-            return current_time
-        
-        time_elapsed = current_time - self.last_access_time[env]
-        duration = CACHE_DURATIONS[env]
-        intervals = int(time_elapsed / duration)
-        
-        return self.last_access_time[env] + (intervals * duration)
+        with self.lock:
+            if not self.last_access_time[env]:
+                self.last_access_time[env] = current_time
+                return current_time
+            
+            time_elapsed = current_time - self.last_access_time[env]
+            duration = CACHE_DURATIONS.get(env, DEFAULT_CACHE_DURATION)
+            intervals = int(time_elapsed / duration)
+            
+            return self.last_access_time[env] + (intervals * duration)
+
+    def get_refresh_lock(self, env, cluster_name):
+        with self.lock:
+            return self.refresh_locks.setdefault((env, cluster_name), threading.Lock())
+
+    def env_cache_stats(self, env):
+        with self.lock:
+            return {**self.cache_stats[env], 'in_flight': self.in_flight[env]}
+
+    def record_lookup(self, env, hit):
+        with self.lock:
+            self.cache_stats[env]['hits' if hit else 'misses'] += 1
 
     def cache_clear(self, env=None):
-        if env is None:
-            self.cache.clear()
-            self.last_access_time.clear()
-        else:
-            if env in self.cache:
-                del self.cache[env]
-                del self.last_access_time[env]
+        with self.lock:
+            if env is None:
+                self.cache.clear()
+                self.entry_bytes.clear()
+                self.env_bytes.clear()
+                self.last_access_time.clear()
+            else:
+                self.cache.pop(env, None)
+                self.entry_bytes.pop(env, None)
+                self.env_bytes.pop(env, None)
+                self.last_access_time.pop(env, None)
+
+    def evict_oldest(self, env):
+        cache_key, _ = self.cache[env].popitem(last=False)
+        self.env_bytes[env] -= self.entry_bytes[env].pop(cache_key, 0)
+
+    def get(self, env, cache_key):
+        with self.lock:
+            if cache_key in self.cache[env]:
+                self.cache[env].move_to_end(cache_key)
+                return self.cache[env][cache_key]
+            return None
+
+    def store(self, env, cache_key, result):
+        size = estimate_result_bytes(result)
+        
+        with self.lock:
+            self.env_bytes[env] += size - self.entry_bytes[env].get(cache_key, 0)
+            self.cache[env][cache_key] = result
+            self.cache[env].move_to_end(cache_key)
+            self.entry_bytes[env][cache_key] = size
+            
+            while len(self.cache[env]) > 1 and (
+                len(self.cache[env]) > self.maxsize
+                or (self.max_bytes and self.env_bytes[env] > self.max_bytes)
+            ):
+                self.evict_oldest(env)
 
     def __call__(self, func):
         def wrapper(cluster_name, env, timestamp, *args, **kwargs):
@@ -52,75 +305,311 @@ class EnvironmentCache:
             current_time = time.time()
             cache_timestamp = self.get_cache_timestamp(env, current_time)
             
-            if current_time > (cache_timestamp + CACHE_DURATIONS[env]):
-                self.cache[env].clear()
-                self.last_access_time[env] = current_time
-                cache_timestamp = current_time
-                cache_key = (cluster_name, cache_timestamp)
-            
-            if cache_key in self.cache[env]:
-                return self.cache[env][cache_key]
-            
-            result = func(cluster_name, env, cache_timestamp, *args, **kwargs)
+            with self.lock:
+                if current_time > (cache_timestamp + CACHE_DURATIONS.get(env, DEFAULT_CACHE_DURATION)):
+                    self.cache[env].clear()
+                    self.entry_bytes[env].clear()
+                    self.env_bytes[env] = 0
+                    self.last_access_time[env] = current_time
+                    cache_timestamp = current_time
+                    cache_key = (cluster_name, cache_timestamp)
             
-            self.cache[env][cache_key] = result
+            result = self.get(env, cache_key)
+            if result is not None:
+                self.record_lookup(env, True)
+                return result
             
-            if len(self.cache[env]) > self.maxsize:
-                oldest_key = min(self.cache[env].keys(), key=lambda k: k[1])
-                self.cache[env].pop(oldest_key)
+            with self.get_refresh_lock(env, cluster_name):
+                result = self.get(env, cache_key)
+                if result is not None:
+                    self.record_lookup(env, True)
+                    return result
+                
+                self.record_lookup(env, False)
+                with self.lock:
+                    self.in_flight[env] += 1
+                try:
+                    result = func(cluster_name, env, cache_timestamp, *args, **kwargs)
+                finally:
+                    with self.lock:
+                        self.in_flight[env] -= 1
+                if 'error' not in result:
+                    self.store(env, cache_key, result)
             
             return result
         return wrapper
 
-cluster_cache = EnvironmentCache(maxsize=256)
+class RedisRefreshLock:
+    def __init__(self, lock, fallback):
+        self.lock = lock
+        self.fallback = fallback
+        self.held = None
 
-def get_secret(secret_name):
-    session = boto3.session.Session()
-    client = session.client(
-        service_name='secretsmanager',
-        region_name='ap-south-1'
-    )
+    def acquire(self, blocking=True):
+        try:
+            self.held = self.lock
+            return self.lock.acquire(blocking=blocking)
+        except redis.exceptions.RedisError:
+            self.held = self.fallback
+            return self.fallback.acquire(blocking)
 
-    try:
-        get_secret_value_response = client.get_secret_value(
-            SecretId=secret_name
+    def release(self):
+        try:
+            self.held.release()
+        except redis.exceptions.RedisError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+class RedisEnvironmentCache(EnvironmentCache):
+    def __init__(self, redis_client, maxsize=256, max_bytes=None, prefix=REDIS_KEY_PREFIX):
+        super().__init__(maxsize, max_bytes)
+        self.redis = redis_client
+        self.prefix = prefix
+
+    def get_key(self, env, *parts):
+        return ":".join([self.prefix, env, *map(str, parts)])
+
+    def get_refresh_lock(self, env, cluster_name):
+        lock = self.redis.lock(
+            self.get_key(env, cluster_name, "lock"),
+            timeout=CLUSTER_FETCH_TIMEOUT * 2,
+            sleep=0.05,
+            thread_local=False,
+            raise_on_release_error=False
         )
-    except ClientError as e:
-        raise e
-    else:
-        if 'SecretString' in get_secret_value_response:
-            secret_dict = json.loads(get_secret_value_response['SecretString'])
-            for host, token in secret_dict.items():
-                return {"host": host, "token": token}
+        return RedisRefreshLock(lock, super().get_refresh_lock(env, cluster_name))
+
+    def get_cache_timestamp(self, env, current_time=None):
+        if current_time is None:
+            current_time = time.time()
+
+        try:
+            anchor_key = self.get_key(env, "anchor")
+            self.redis.set(anchor_key, repr(current_time), nx=True)
+            anchor = float(self.redis.get(anchor_key))
+        except redis.exceptions.RedisError:
+            return super().get_cache_timestamp(env, current_time)
+
+        with self.lock:
+            self.last_access_time[env] = anchor
+        duration = CACHE_DURATIONS.get(env, DEFAULT_CACHE_DURATION)
+        return anchor + int((current_time - anchor) / duration) * duration
+
+    def get(self, env, cache_key):
+        result = super().get(env, cache_key)
+        if result is not None:
+            return result
+
+        try:
+            payload = self.redis.get(self.get_key(env, *cache_key))
+        except redis.exceptions.RedisError:
+            return None
+        if payload is None:
+            return None
+
+        result = loads_json(payload)
+        result['deployments'] = [DeploymentRecord.from_dict(info) for info in result['deployments']]
+        with self.lock:
+            cached = super().get(env, cache_key)
+            if cached is not None:
+                return cached
+            super().store(env, cache_key, result)
+        return result
+
+    def store(self, env, cache_key, result):
+        super().store(env, cache_key, result)
+
+        ttl = int(CACHE_DURATIONS.get(env, DEFAULT_CACHE_DURATION) * REDIS_STALE_INTERVALS)
+        try:
+            self.redis.set(self.get_key(env, *cache_key), dumps_stored_json(result), ex=ttl)
+        except redis.exceptions.RedisError:
+            pass
+
+    def cache_clear(self, env=None):
+        super().cache_clear(env)
+        try:
+            pattern = self.get_key(env, "*") if env else f"{self.prefix}:*"
+            keys = list(self.redis.scan_iter(match=pattern))
+            if keys:
+                self.redis.delete(*keys)
+        except redis.exceptions.RedisError:
+            pass
+
+def create_cluster_cache():
+    if CACHE_BACKEND == "redis":
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package")
+        redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_TIMEOUT,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            retry=Retry(NoBackoff(), 1)
+        )
+        return RedisEnvironmentCache(redis_client, maxsize=256, max_bytes=CACHE_MAX_BYTES)
+    return EnvironmentCache(maxsize=256, max_bytes=CACHE_MAX_BYTES)
+
+cluster_cache = create_cluster_cache()
+
+cluster_executor = ThreadPoolExecutor(max_workers=CLUSTER_FETCH_CONCURRENCY, thread_name_prefix="cluster-fetch")
+
+secrets_client = None
+secrets_batch_denied = False
+secret_cache = {}
+secret_cache_lock = threading.Lock()
+
+def get_secrets_client():
+    global secrets_client
+    if secrets_client is None:
+        session = boto3.session.Session()
+        secrets_client = session.client(
+            service_name='secretsmanager',
+            region_name=SECRETS_REGION
+        )
+    return secrets_client
+
+def parse_secret(secret_dict):
+    for host, token in (secret_dict or {}).items():
+        return {"host": host, "token": token}
     return None
 
+def fetch_individual_secret_values(secrets, secret_names):
+    secret_values = []
+    for secret_name in secret_names:
+        try:
+            secret_values.append(secrets.get_secret_value(SecretId=secret_name))
+        except ClientError as e:
+            error = e.response.get('Error', {})
+            print(f"Error retrieving secret {secret_name}: {error.get('Code')} {error.get('Message')}")
+    return secret_values
+
+def fetch_secret_values(secret_names):
+    global secrets_batch_denied
+    secrets = get_secrets_client()
+    if not SECRETS_BATCH_ENABLED or secrets_batch_denied or not hasattr(secrets, 'batch_get_secret_value'):
+        return fetch_individual_secret_values(secrets, secret_names)
+
+    secret_values = []
+    for start in range(0, len(secret_names), SECRETS_BATCH_SIZE):
+        kwargs = {'SecretIdList': secret_names[start:start + SECRETS_BATCH_SIZE]}
+        while True:
+            try:
+                response = secrets.batch_get_secret_value(**kwargs)
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') != 'AccessDeniedException':
+                    raise
+                print("secretsmanager:BatchGetSecretValue is not granted to this role, falling back to GetSecretValue per secret")
+                secrets_batch_denied = True
+                return secret_values + fetch_individual_secret_values(secrets, secret_names[start:])
+            secret_values.extend(response.get('SecretValues', []))
+            for error in response.get('Errors', []):
+                print(f"Error retrieving secret {error.get('SecretId')}: {error.get('ErrorCode')} {error.get('Message')}")
+            if not response.get('NextToken'):
+                break
+            kwargs['NextToken'] = response['NextToken']
+    return secret_values
+
+def get_secrets(secret_names):
+    now = time.time()
+    with secret_cache_lock:
+        missing = [
+            secret_name for secret_name in secret_names
+            if secret_name not in secret_cache or now - secret_cache[secret_name]['fetched_at'] >= SECRET_CACHE_TTL
+        ]
+
+    if missing:
+        secret_values = fetch_secret_values(missing)
+
+        with secret_cache_lock:
+            for secret_value in secret_values:
+                secret_name = secret_value['Name'] if secret_value['Name'] in missing else secret_value['ARN']
+                cached = secret_cache.get(secret_name)
+                if cached and cached['version_id'] != secret_value.get('VersionId'):
+                    print(f"Secret {secret_name} rotated to version {secret_value.get('VersionId')}")
+                secret_cache[secret_name] = {
+                    'value': json.loads(secret_value['SecretString']) if 'SecretString' in secret_value else None,
+                    'version_id': secret_value.get('VersionId'),
+                    'fetched_at': now
+                }
+
+    with secret_cache_lock:
+        return {
+            secret_name: secret_cache[secret_name]['value']
+            for secret_name in secret_names
+            if secret_name in secret_cache
+        }
+
+def get_secret(secret_name):
+    return parse_secret(get_secrets([secret_name]).get(secret_name))
+
+def invalidate_secret_cache():
+    with secret_cache_lock:
+        secret_cache.clear()
+
 def init_clusters():
     try:
-        minikube_creds = get_secret('cluster_creds')
-        aks_creds = get_secret('aks_creds')
+        if CLUSTERS_SECRET_NAME:
+            cluster_config = get_secrets([CLUSTERS_SECRET_NAME]).get(CLUSTERS_SECRET_NAME) or {}
+        else:
+            secret_names = sorted({
+                secret_name
+                for env_secrets in CLUSTER_SECRETS.values()
+                for secret_name in env_secrets.values()
+            })
+            secrets = get_secrets(secret_names)
+            cluster_config = {
+                env: {
+                    cluster_name: parse_secret(secrets[secret_name])
+                    for cluster_name, secret_name in env_secrets.items()
+                    if parse_secret(secrets.get(secret_name))
+                }
+                for env, env_secrets in CLUSTER_SECRETS.items()
+            }
 
-        if not minikube_creds or not aks_creds:
+        cluster_config = {env: env_clusters for env, env_clusters in cluster_config.items() if env_clusters}
+        if not cluster_config:
             raise Exception("Failed to retrieve cluster credentials from Secrets Manager")
 
-        cluster_config = {
-            "poc": {
-                "minikube": minikube_creds,
-                "aks-pe-poc": aks_creds
-            },
-            "dev": {
-                "minikube": minikube_creds
-            }
-        }
         return cluster_config
     except Exception as e:
         print(f"Error initializing clusters: {str(e)}")
         raise
 
-k8s_clients = {env: {} for env in ["poc", "dev"]}
+k8s_clients = defaultdict(dict)
+
+client_credentials = {}
+
+env_indexes = {}
+env_indexes_lock = threading.Lock()
+
+drift_tables = OrderedDict()
+drift_tables_lock = threading.Lock()
+
+api_call_metrics = threading.local()
 
 def get_formatted_datetime():
     return datetime.now().strftime("%d-%m-%Y %I:%M %p")
 
+def emit_metrics(dimensions, values, properties=None):
+    print(json.dumps({
+        '_aws': {
+            'Timestamp': int(time.time() * 1000),
+            'CloudWatchMetrics': [{
+                'Namespace': METRICS_NAMESPACE,
+                'Dimensions': [list(dimensions)],
+                'Metrics': [{'Name': name, 'Unit': METRIC_UNITS[name]} for name in values]
+            }]
+        },
+        **dimensions,
+        **(properties or {}),
+        **values
+    }))
+
 def initialize_k8s_clients(env, clusters):
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
     for cluster_name, cluster_info in clusters[env].items():
@@ -134,23 +623,215 @@ def initialize_k8s_clients(env, clusters):
             "apps_v1": client.AppsV1Api(api_client),
             "core_v1": client.CoreV1Api(api_client)
         }
+    client_credentials[env] = dict(clusters[env])
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def parse_image_reference(image_string):
+    name, _, digest = image_string.partition("@")
+    tag = None
+    if name.rfind(":") > name.rfind("/"):
+        name, tag = name.rsplit(":", 1)
+    registry = None
+    first, separator, remainder = name.partition("/")
+    if separator and ("." in first or ":" in first or first == "localhost"):
+        registry, name = first, remainder
+    return ImageReference(
+        sys.intern(registry) if registry else None,
+        sys.intern(name),
+        sys.intern(tag) if tag else None,
+        sys.intern(digest) if digest else None
+    )
 
 def extract_version_from_image(image_string):
-    match = VERSION_PATTERN.search(image_string)
-    if not match:
-        return "None"
-    return match.group(1)
+    return parse_image_reference(image_string).version
+
+def extract_repository_from_image(image_string):
+    return parse_image_reference(image_string).name
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def get_container_image(image, name=""):
+    reference = parse_image_reference(image)
+    return ContainerImage(sys.intern(image), sys.intern(reference.version), reference, sys.intern(name))
+
+def get_container_images(images, names=None):
+    if names is None:
+        return tuple(map(get_container_image, images))
+    return tuple(map(get_container_image, images, names))
 
 def process_container_images(containers):
     if not containers:
-        return []
-    return [{
-        "image": container.image,
-        "version": extract_version_from_image(container.image)
-    } for container in containers]
+        return ()
+    return get_container_images([container.image for container in containers], [container.name or "" for container in containers])
+
+def build_deployment_info(deployment, cluster_name):
+    pod_spec = deployment.spec.template.spec
+    return DeploymentRecord(
+        cluster_name,
+        deployment.metadata.name,
+        deployment.metadata.namespace,
+        process_container_images(pod_spec.containers),
+        process_container_images(pod_spec.init_containers)
+    )
+
+def process_raw_container_images(containers):
+    if not containers:
+        return ()
+    return get_container_images(
+        [container.get("image") or "" for container in containers],
+        [container.get("name") or "" for container in containers]
+    )
+
+def build_raw_deployment_info(item, cluster_name):
+    pod_spec = item["spec"]["template"]["spec"]
+    return DeploymentRecord(
+        cluster_name,
+        item["metadata"]["name"],
+        item["metadata"]["namespace"],
+        process_raw_container_images(pod_spec.get("containers")),
+        process_raw_container_images(pod_spec.get("initContainers"))
+    )
+
+def build_table_deployment_infos(table, cluster_name):
+    columns = [column["name"] for column in table["columnDefinitions"]]
+    images_column = columns.index("Images")
+    containers_column = columns.index("Containers") if "Containers" in columns else None
+    infos = []
+    for row in table.get("rows") or []:
+        metadata = row["object"]["metadata"]
+        images = [image for image in row["cells"][images_column].split(",") if image]
+        names = None
+        if containers_column is not None:
+            names = [name for name in row["cells"][containers_column].split(",") if name]
+            if len(names) != len(images):
+                names = None
+        infos.append(DeploymentRecord(
+            cluster_name,
+            metadata["name"],
+            metadata["namespace"],
+            get_container_images(images, names),
+            ()
+        ))
+    return infos
+
+def loads_json(payload):
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+def call_k8s_api(operation, namespace, call, *args, **kwargs):
+    started = time.perf_counter()
+    status = 200
+    try:
+        return call(*args, **kwargs)
+    except ApiException as e:
+        status = e.status
+        raise
+    except Exception:
+        status = None
+        raise
+    finally:
+        calls = getattr(api_call_metrics, 'calls', None)
+        if calls is not None:
+            calls.append((operation, namespace, status, (time.perf_counter() - started) * 1000))
+
+def read_raw_response(list_call, *args, **kwargs):
+    response = list_call(*args, _preload_content=False, **kwargs)
+    try:
+        return response.data
+    finally:
+        response.release_conn()
+
+def list_deployment_page(list_call, cluster_name, *args, **kwargs):
+    operation = list_call.__name__
+    namespace = args[0] if args else None
+    if DEPLOYMENT_FETCH_MODE == "model":
+        page = call_k8s_api(operation, namespace, list_call, *args, **kwargs)
+        infos = [build_deployment_info(deployment, cluster_name) for deployment in page.items]
+        return infos, page.metadata._continue
+
+    if DEPLOYMENT_FETCH_MODE == "table":
+        kwargs["_headers"] = {"Accept": TABLE_ACCEPT_HEADER}
+    body = loads_json(call_k8s_api(operation, namespace, read_raw_response, list_call, *args, **kwargs))
+
+    if body.get("kind") == "Table":
+        infos = build_table_deployment_infos(body, cluster_name)
+    else:
+        infos = [build_raw_deployment_info(item, cluster_name) for item in body.get("items") or []]
+    return infos, (body.get("metadata") or {}).get("continue")
+
+def iter_cluster_deployment_pages(cluster_clients, cluster_name):
+    continue_token = None
+    while True:
+        kwargs = {"limit": DEPLOYMENT_PAGE_SIZE}
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        infos, continue_token = list_deployment_page(
+            cluster_clients["apps_v1"].list_deployment_for_all_namespaces,
+            cluster_name,
+            _request_timeout=CLUSTER_FETCH_TIMEOUT,
+            **kwargs
+        )
+        yield infos
+        if not continue_token:
+            break
+
+def iter_namespaced_deployment_pages(cluster_clients, cluster_name):
+    namespaces = call_k8s_api("list_namespace", None, cluster_clients["core_v1"].list_namespace, _request_timeout=CLUSTER_FETCH_TIMEOUT)
+    for ns in namespaces.items:
+        infos, _ = list_deployment_page(
+            cluster_clients["apps_v1"].list_namespaced_deployment,
+            cluster_name,
+            ns.metadata.name,
+            _request_timeout=CLUSTER_FETCH_TIMEOUT
+        )
+        yield infos
+
+def iter_deployment_pages(cluster_clients, cluster_name):
+    if DEPLOYMENT_COLLECTION_MODE == "namespaced":
+        yield from iter_namespaced_deployment_pages(cluster_clients, cluster_name)
+        return
+
+    pages = iter_cluster_deployment_pages(cluster_clients, cluster_name)
+    try:
+        first_page = next(pages, [])
+    except ApiException as e:
+        if e.status != 403:
+            raise
+        print(f"Cluster-wide deployment list forbidden, falling back to per-namespace scan: {str(e.reason)}")
+        yield from iter_namespaced_deployment_pages(cluster_clients, cluster_name)
+        return
+
+    yield first_page
+    yield from pages
+
+def emit_sweep_metrics(env, cluster_name, started, deployments, failed=False):
+    calls = api_call_metrics.calls or []
+    api_call_metrics.calls = None
+
+    values = {
+        'SweepLatency': round((time.perf_counter() - started) * 1000, 3),
+        'SweepErrors': int(failed),
+        'Deployments': len(deployments),
+        'Namespaces': len({deployment["namespace"] for deployment in deployments}),
+        'ApiCalls': len(calls),
+        'ApiErrors': sum(1 for _, _, status, _ in calls if status != 200),
+        'RefreshesInFlight': cluster_cache.env_cache_stats(env)['in_flight']
+    }
+    if calls:
+        values['ApiLatency'] = [round(latency, 3) for _, _, _, latency in calls[:METRIC_MAX_VALUES]]
+
+    properties = {}
+    namespace_calls = [(latency, namespace) for _, namespace, _, latency in calls if namespace]
+    if namespace_calls:
+        latency, namespace = max(namespace_calls)
+        properties = {'SlowestNamespace': namespace, 'SlowestNamespaceLatency': round(latency, 3)}
+
+    emit_metrics({'Env': env, 'Cluster': cluster_name}, values, properties)
 
 @cluster_cache
 def get_cluster_deployments(cluster_name, env, timestamp, clients):
+    started = time.perf_counter()
+    api_call_metrics.calls = []
     try:
         if cluster_name not in clients[env]:
             return {'deployments': [], 'timestamp': get_formatted_datetime()}
@@ -158,29 +839,368 @@ def get_cluster_deployments(cluster_name, env, timestamp, clients):
         cluster_clients = clients[env][cluster_name]
         deployments_list = []
         
-        namespaces = cluster_clients["core_v1"].list_namespace()
-        
-        for ns in namespaces.items:
-            namespace_name = ns.metadata.name
-            deployments = cluster_clients["apps_v1"].list_namespaced_deployment(namespace_name)
-            
-            for deployment in deployments.items:
-                deployment_info = {
-                    "cluster": cluster_name,
-                    "deployment-name": deployment.metadata.name,
-                    "namespace": namespace_name,
-                    "main-containers": process_container_images(deployment.spec.template.spec.containers),
-                    "init-containers": process_container_images(deployment.spec.template.spec.init_containers) if deployment.spec.template.spec.init_containers else []
-                }
-                deployments_list.append(deployment_info)
+        for deployments in iter_deployment_pages(cluster_clients, cluster_name):
+            deployments_list.extend(deployments)
         
+        emit_sweep_metrics(env, cluster_name, started, deployments_list)
         return {
             'deployments': deployments_list,
             'timestamp': get_formatted_datetime()
         }
     except Exception as e:
         print(f"Error getting deployments for cluster {cluster_name}: {str(e)}")
-        return {'deployments': [], 'timestamp': get_formatted_datetime()}
+        emit_sweep_metrics(env, cluster_name, started, [], failed=True)
+        if isinstance(e, ApiException) and e.status == 401:
+            invalidate_secret_cache()
+        return {
+            'deployments': [],
+            'timestamp': get_formatted_datetime(),
+            'error': {
+                'type': 'GeneralException',
+                'message': str(e)
+            }
+        }
+
+def fetch_env_clusters(env, clusters, timestamp):
+    futures = {
+        cluster_executor.submit(get_cluster_deployments, cluster_name, env, timestamp, k8s_clients): cluster_name
+        for cluster_name in clusters[env].keys()
+    }
+    done, _ = wait(futures, timeout=CLUSTER_FETCH_TIMEOUT)
+
+    results = {}
+    for future, cluster_name in futures.items():
+        if future not in done:
+            future.cancel()
+            print(f"Cluster {cluster_name} timed out after {CLUSTER_FETCH_TIMEOUT:g}s")
+            results[cluster_name] = {
+                'deployments': [],
+                'timestamp': None,
+                'error': {
+                    'type': 'ClusterTimeout',
+                    'message': f"Cluster '{cluster_name}' did not respond within {CLUSTER_FETCH_TIMEOUT:g}s"
+                }
+            }
+        else:
+            results[cluster_name] = future.result()
+    return results
+
+def get_main_container_field(deployment, field):
+    containers = deployment["main-containers"]
+    return containers[0][field] if containers else ""
+
+def get_container_versions(deployment):
+    versions = defaultdict(set)
+    for container in deployment["main-containers"] + deployment["init-containers"]:
+        versions[container.container].add(container.version)
+    return {container: ",".join(sorted(container_versions)) for container, container_versions in versions.items()}
+
+SORT_FIELDS = {
+    "name": lambda deployment: deployment["deployment-name"],
+    "version": lambda deployment: get_main_container_field(deployment, "version"),
+    "image": lambda deployment: get_main_container_field(deployment, "image"),
+}
+
+def get_cached_response_body(response_cache, lock, response_key, build_response, encoding):
+    with lock:
+        variants = response_cache.get(response_key)
+        if variants is not None:
+            response_cache.move_to_end(response_key)
+
+    if variants is None:
+        started = time.perf_counter()
+        variants = {'identity': dumps_json(build_response())}
+        emit_serialization_metrics('identity', started, variants['identity'])
+    if len(variants['identity']) < COMPRESSION_MIN_BYTES:
+        encoding = 'identity'
+    if encoding not in variants:
+        started = time.perf_counter()
+        variants[encoding] = compress_body(variants['identity'], encoding)
+        emit_serialization_metrics(encoding, started, variants[encoding])
+
+    with lock:
+        response_cache[response_key] = variants
+        if len(response_cache) > QUERY_CACHE_SIZE:
+            response_cache.popitem(last=False)
+    return variants[encoding], encoding
+
+class DeploymentIndex:
+    def __init__(self, sources):
+        self.sources = sources
+        self.deployments = [deployment for source in sources for deployment in source]
+        self.by_cluster = defaultdict(list)
+        self.by_namespace = defaultdict(list)
+        self.by_image = defaultdict(lambda: defaultdict(list))
+        self.cluster_namespaces = defaultdict(set)
+        self.container_versions = defaultdict(dict)
+        self.search_text = []
+
+        for position, deployment in enumerate(self.deployments):
+            self.by_cluster[deployment["cluster"]].append(position)
+            self.by_namespace[deployment["namespace"]].append(position)
+            self.cluster_namespaces[deployment["cluster"]].add(deployment["namespace"])
+            containers = deployment["main-containers"] + deployment["init-containers"]
+            for repository, version in {(container.reference.name, container.version) for container in containers}:
+                self.by_image[repository][version].append(position)
+            images = [container["image"] for container in containers]
+            self.search_text.append("\n".join([deployment["deployment-name"], deployment["namespace"], *images]).lower())
+            for container, version in get_container_versions(deployment).items():
+                self.container_versions[(deployment["namespace"], deployment["deployment-name"], container)][deployment["cluster"]] = version
+
+        self.namespaces = sorted(self.by_namespace)
+        self.cluster_namespaces = {cluster: sorted(namespaces) for cluster, namespaces in self.cluster_namespaces.items()}
+
+        self.sort_ranks = {}
+        for field, get_value in SORT_FIELDS.items():
+            order = sorted(range(len(self.deployments)), key=lambda position: get_value(self.deployments[position]).lower())
+            ranks = [0] * len(order)
+            for rank, position in enumerate(order):
+                ranks[position] = rank
+            self.sort_ranks[field] = ranks
+
+        self.query_cache = OrderedDict()
+        self.response_cache = OrderedDict()
+        self.content_hash = None
+        self.lock = threading.Lock()
+
+    def get_content_hash(self):
+        with self.lock:
+            if self.content_hash is None:
+                payload = json.dumps(self.deployments, sort_keys=True, separators=(",", ":"), default=to_stored_json_value)
+                self.content_hash = hashlib.sha256(payload.encode()).hexdigest()
+            return self.content_hash
+
+    def matches_sources(self, sources):
+        return len(self.sources) == len(sources) and all(a is b for a, b in zip(self.sources, sources))
+
+    def query(self, cluster=None, namespace=None, search=None, sort=None, descending=False):
+        query_key = (cluster, namespace, search, sort, descending)
+        with self.lock:
+            if query_key in self.query_cache:
+                self.query_cache.move_to_end(query_key)
+                return self.query_cache[query_key]
+
+        if cluster and namespace:
+            namespace_positions = set(self.by_namespace.get(namespace, []))
+            positions = [position for position in self.by_cluster.get(cluster, []) if position in namespace_positions]
+        elif cluster:
+            positions = self.by_cluster.get(cluster, [])
+        elif namespace:
+            positions = self.by_namespace.get(namespace, [])
+        else:
+            positions = range(len(self.deployments))
+
+        if search:
+            search = search.lower()
+            positions = [position for position in positions if search in self.search_text[position]]
+
+        if sort:
+            positions = sorted(positions, key=self.sort_ranks[sort].__getitem__, reverse=descending)
+
+        positions = list(positions)
+        with self.lock:
+            self.query_cache[query_key] = positions
+            if len(self.query_cache) > QUERY_CACHE_SIZE:
+                self.query_cache.popitem(last=False)
+        return positions
+
+    def page(self, positions, page, page_size):
+        start = (page - 1) * page_size
+        return [self.deployments[position] for position in positions[start:start + page_size]]
+
+    def get_response_body(self, response_key, build_response, encoding):
+        return get_cached_response_body(self.response_cache, self.lock, response_key, build_response, encoding)
+
+    def image_versions(self, repository, version=None):
+        versions = self.by_image.get(repository, {})
+        if version is not None:
+            versions = {version: versions[version]} if version in versions else {}
+        return {
+            image_version: [self.deployments[position] for position in positions]
+            for image_version, positions in versions.items()
+        }
+
+class DriftTable:
+    def __init__(self, envs, indexes):
+        self.envs = envs
+        self.indexes = indexes
+        self.clusters = {env: sorted(index.by_cluster) for env, index in zip(envs, indexes)}
+
+        versions = defaultdict(dict)
+        for env, index in zip(envs, indexes):
+            for key, cluster_versions in index.container_versions.items():
+                versions[key][env] = cluster_versions
+
+        self.rows = []
+        for (namespace, deployment_name, container), env_versions in sorted(versions.items()):
+            missing = [env for env in envs if env not in env_versions]
+            distinct = {version for cluster_versions in env_versions.values() for version in cluster_versions.values()}
+            self.rows.append({
+                'namespace': namespace,
+                'deployment-name': deployment_name,
+                'container': container,
+                'versions': env_versions,
+                'missing': missing,
+                'drift': len(distinct) > 1 or bool(missing)
+            })
+        self.drifted = [row for row in self.rows if row['drift']]
+
+        self.response_cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_response_body(self, response_key, build_response, encoding):
+        return get_cached_response_body(self.response_cache, self.lock, response_key, build_response, encoding)
+
+    def matches_indexes(self, indexes):
+        return len(self.indexes) == len(indexes) and all(a is b for a, b in zip(self.indexes, indexes))
+
+def get_drift_table(envs, indexes):
+    with drift_tables_lock:
+        table = drift_tables.get(envs)
+        if table is not None and table.matches_indexes(indexes):
+            drift_tables.move_to_end(envs)
+            return table
+
+    table = DriftTable(envs, indexes)
+    with drift_tables_lock:
+        drift_tables[envs] = table
+        drift_tables.move_to_end(envs)
+        if len(drift_tables) > QUERY_CACHE_SIZE:
+            drift_tables.popitem(last=False)
+    return table
+
+def materialize_drift_tables(envs):
+    with drift_tables_lock:
+        env_sets = list(drift_tables) or [tuple(envs)]
+
+    for drift_envs in env_sets:
+        with env_indexes_lock:
+            indexes = tuple(env_indexes.get(env) for env in drift_envs)
+        if all(index is not None for index in indexes):
+            get_drift_table(drift_envs, indexes)
+
+def parse_drift_envs(value, clusters):
+    envs = []
+    for env in (value or '').split(','):
+        env = env.strip().lower()
+        if env and env not in envs:
+            envs.append(env)
+    return tuple(envs) or tuple(clusters.keys())
+
+def build_drift_etag(indexes, errors, params, *validators):
+    digest = hashlib.sha256()
+    for index in indexes:
+        digest.update(index.get_content_hash().encode())
+    digest.update(json.dumps(errors, sort_keys=True).encode())
+    digest.update(json.dumps(validators).encode())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+def get_env_index(env, results):
+    sources = [result['deployments'] for result in results.values() if 'error' not in result]
+    with env_indexes_lock:
+        index = env_indexes.get(env)
+        if index is None or not index.matches_sources(sources):
+            index = DeploymentIndex(sources)
+            env_indexes[env] = index
+        return index
+
+def parse_deployment_query(params):
+    sort = params.get('sort') or None
+    descending = bool(sort) and sort.startswith('-')
+    if sort:
+        sort = sort.lstrip('-')
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field '{sort}', expected one of: {', '.join(SORT_FIELDS)}")
+
+    try:
+        page = int(params.get('page', 1))
+        page_size = int(params.get('page_size', DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("'page' and 'page_size' must be integers")
+    if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"'page' must be >= 1 and 'page_size' between 1 and {MAX_PAGE_SIZE}")
+
+    return {
+        'cluster': params.get('cluster') or None,
+        'namespace': params.get('namespace') or None,
+        'search': params.get('search') or None,
+        'sort': sort,
+        'descending': descending,
+        'page': page,
+        'page_size': page_size
+    }
+
+def dumps_json(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, default=to_json_value).decode()
+    return json.dumps(payload, default=to_json_value)
+
+def dumps_stored_json(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, default=to_stored_json_value).decode()
+    return json.dumps(payload, default=to_stored_json_value)
+
+def emit_serialization_metrics(encoding, started, body):
+    emit_metrics({'Encoding': encoding}, {
+        'SerializationTime': round((time.perf_counter() - started) * 1000, 3),
+        'ResponseBytes': len(body)
+    })
+
+def compress_body(body, encoding):
+    if encoding == 'br':
+        return base64.b64encode(brotli.compress(body.encode())).decode()
+    if encoding == 'gzip':
+        return base64.b64encode(gzip.compress(body.encode(), compresslevel=6)).decode()
+    return body
+
+def choose_encoding(accept_encoding):
+    accepted = set()
+    for part in (accept_encoding or '').split(','):
+        coding, _, quality = part.partition(';')
+        quality = quality.strip().replace(' ', '')
+        try:
+            if quality.startswith('q=') and float(quality[2:]) == 0:
+                continue
+        except ValueError:
+            continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    if brotli is not None and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return 'identity'
+
+def build_etag(index, errors, params, *validators):
+    digest = hashlib.sha256(index.get_content_hash().encode())
+    digest.update(json.dumps(errors, sort_keys=True).encode())
+    digest.update(json.dumps(validators).encode())
+    digest.update(json.dumps(params, sort_keys=True).encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+def get_request_header(event, name):
+    for header, value in (event.get('headers') or {}).items():
+        if header.lower() == name.lower():
+            return value
+    return None
+
+def is_paged_query(params):
+    return any(param in params for param in ('cluster', 'namespace', 'search', 'sort', 'page', 'page_size'))
+
+def ensure_k8s_clients(env, clusters):
+    if not k8s_clients[env] or client_credentials.get(env) != clusters[env]:
+        k8s_clients[env].clear()
+        initialize_k8s_clients(env, clusters)
+
+def emit_cache_metrics(env, before, after):
+    hits = after['hits'] - before['hits']
+    misses = after['misses'] - before['misses']
+    emit_metrics({'Env': env}, {
+        'CacheHits': hits,
+        'CacheMisses': misses,
+        'CacheHitRatio': round(100 * hits / (hits + misses), 2) if hits + misses else 0
+    })
 
 def get_deployments_for_env(env, clusters, refresh_cache=False):
     if refresh_cache:
@@ -189,28 +1209,73 @@ def get_deployments_for_env(env, clusters, refresh_cache=False):
             k8s_clients[env].clear()
         initialize_k8s_clients(env, clusters)
     
-    if not k8s_clients[env]:
-        initialize_k8s_clients(env, clusters)
+    ensure_k8s_clients(env, clusters)
         
     timestamp = cluster_cache.get_cache_timestamp(env)
-    all_deployments = []
+    errors = []
     cached_timestamp = None
     
-    for cluster_name in clusters[env].keys():
-        result = get_cluster_deployments(cluster_name, env, timestamp, k8s_clients)
-        all_deployments.extend(result['deployments'])
+    cache_stats = cluster_cache.env_cache_stats(env)
+    results = fetch_env_clusters(env, clusters, timestamp)
+    emit_cache_metrics(env, cache_stats, cluster_cache.env_cache_stats(env))
+    for cluster_name, result in results.items():
+        if 'error' in result:
+            errors.append({'cluster': cluster_name, **result['error']})
         if cached_timestamp is None:
             cached_timestamp = result['timestamp']
     
-    return all_deployments, cached_timestamp
+    return get_env_index(env, results), cached_timestamp, errors
+
+def warm_all_caches(clusters):
+    warmed = {}
+    current_time = time.time()
+    for env in clusters:
+        ensure_k8s_clients(env, clusters)
+        duration = CACHE_DURATIONS.get(env, DEFAULT_CACHE_DURATION)
+        timestamp = cluster_cache.get_cache_timestamp(env, current_time)
+        buckets = [timestamp]
+        
+        results = fetch_env_clusters(env, clusters, timestamp)
+        get_env_index(env, results)
+        errors = [{'cluster': cluster_name, **result['error']} for cluster_name, result in results.items() if 'error' in result]
+        
+        if timestamp + duration - current_time <= CACHE_WARM_LEAD:
+            next_timestamp = cluster_cache.get_cache_timestamp(env, timestamp + duration * 1.5)
+            buckets.append(next_timestamp)
+            results = fetch_env_clusters(env, clusters, next_timestamp)
+            errors.extend({'cluster': cluster_name, **result['error']} for cluster_name, result in results.items() if 'error' in result)
+        
+        warmed[env] = {'buckets': buckets, 'errors': errors}
+    materialize_drift_tables(clusters)
+    return warmed
+
+def is_scheduled_event(event):
+    return event.get('source') == 'aws.events' or event.get('detail-type') == 'Scheduled Event'
 
 def clear_all_caches():
     cluster_cache.cache_clear()
+    invalidate_secret_cache()
+    client_credentials.clear()
     for env in k8s_clients:
         k8s_clients[env].clear()
 
 def lambda_handler(event, context):
     try:
+        if is_scheduled_event(event):
+            warmed = warm_all_caches(init_clusters())
+            print(f"Warmed caches: {json.dumps(warmed)}")
+            return {
+                'statusCode': 200,
+                'headers': {
+                    'Content-Type': 'application/json'
+                },
+                'body': json.dumps({
+                    'status': 'success',
+                    'warmed': warmed,
+                    'date_time': get_formatted_datetime()
+                })
+            }
+        
         path = event.get('path') or event.get('rawPath', '')
         print(f"Received request with event: {json.dumps(event)}") 
         print(f"Received path: {path}")
@@ -269,6 +1334,86 @@ def lambda_handler(event, context):
                 })
             }
         
+        if path == 'api/drift':
+            params = event.get('queryStringParameters') or {}
+            envs = parse_drift_envs(params.get('envs'), clusters)
+            for env in envs:
+                if env not in clusters:
+                    return {
+                        'statusCode': 404,
+                        'headers': {
+                            'Content-Type': 'application/json',
+                            'Access-Control-Allow-Origin': '*'
+                        },
+                        'body': json.dumps({
+                            'status': 'error',
+                            'error': {
+                                'type': 'InvalidEnvironment',
+                                'message': f"Environment '{env}' not supported"
+                            }
+                        })
+                    }
+
+            indexes = []
+            errors = []
+            cached_time = None
+            for env in envs:
+                index, env_cached_time, env_errors = get_deployments_for_env(env, clusters)
+                indexes.append(index)
+                errors.extend({'env': env, **error} for error in env_errors)
+                cached_time = cached_time or env_cached_time
+
+            table = get_drift_table(envs, tuple(indexes))
+
+            etag = build_drift_etag(indexes, errors, params, cached_time)
+            if_none_match = get_request_header(event, 'If-None-Match')
+            if if_none_match and (if_none_match.strip() == '*' or etag in [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]):
+                return {
+                    'statusCode': 304,
+                    'headers': {
+                        'ETag': etag,
+                        'Access-Control-Allow-Origin': '*',
+                        'Access-Control-Expose-Headers': 'ETag'
+                    },
+                    'body': ''
+                }
+
+            drifted_only = params.get('drifted', 'false').lower() == 'true'
+
+            def build_response():
+                return {
+                    'status': 'success',
+                    'data': table.drifted if drifted_only else table.rows,
+                    'envs': list(envs),
+                    'clusters': table.clusters,
+                    'total': len(table.rows),
+                    'drifted': len(table.drifted),
+                    'errors': errors,
+                    'date_time': cached_time
+                }
+
+            body, encoding = table.get_response_body(
+                (etag, cached_time),
+                build_response,
+                choose_encoding(get_request_header(event, 'Accept-Encoding'))
+            )
+            headers = {
+                'Content-Type': 'application/json',
+                'ETag': etag,
+                'Vary': 'Accept-Encoding',
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Expose-Headers': 'ETag'
+            }
+            if encoding != 'identity':
+                headers['Content-Encoding'] = encoding
+
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': body,
+                'isBase64Encoded': encoding != 'identity'
+            }
+
         if len(path_parts) == 2:
             env = path_parts[1].lower()
             
@@ -288,7 +1433,112 @@ def lambda_handler(event, context):
                     })
                 }
                 
-            all_deployments, cached_time = get_deployments_for_env(env, clusters)
+            params = event.get('queryStringParameters') or {}
+            try:
+                query = parse_deployment_query(params) if is_paged_query(params) else None
+            except ValueError as e:
+                return {
+                    'statusCode': 400,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'status': 'error',
+                        'error': {
+                            'type': 'InvalidQuery',
+                            'message': str(e)
+                        }
+                    })
+                }
+
+            index, cached_time, errors = get_deployments_for_env(env, clusters)
+            
+            etag = build_etag(index, errors, params, cached_time)
+            if_none_match = get_request_header(event, 'If-None-Match')
+            if if_none_match and (if_none_match.strip() == '*' or etag in [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]):
+                return {
+                    'statusCode': 304,
+                    'headers': {
+                        'ETag': etag,
+                        'Access-Control-Allow-Origin': '*',
+                        'Access-Control-Expose-Headers': 'ETag'
+                    },
+                    'body': ''
+                }
+            
+            def build_response():
+                response = {
+                    'status': 'success',
+                    'data': index.deployments,
+                    'errors': errors,
+                    'date_time': cached_time
+                }
+                if query:
+                    positions = index.query(query['cluster'], query['namespace'], query['search'], query['sort'], query['descending'])
+                    response.update({
+                        'data': index.page(positions, query['page'], query['page_size']),
+                        'total': len(positions),
+                        'page': query['page'],
+                        'page_size': query['page_size']
+                    })
+                return response
+            
+            body, encoding = index.get_response_body(
+                (etag, cached_time),
+                build_response,
+                choose_encoding(get_request_header(event, 'Accept-Encoding'))
+            )
+            headers = {
+                'Content-Type': 'application/json',
+                'ETag': etag,
+                'Vary': 'Accept-Encoding',
+                'Access-Control-Allow-Origin': '*',
+                'Access-Control-Expose-Headers': 'ETag'
+            }
+            if encoding != 'identity':
+                headers['Content-Encoding'] = encoding
+            
+            return {
+                'statusCode': 200,
+                'headers': headers,
+                'body': body,
+                'isBase64Encoded': encoding != 'identity'
+            }
+            
+        if (len(path_parts) == 3 and path_parts[2] == 'namespaces') or (len(path_parts) >= 4 and path_parts[2] == 'images'):
+            env = path_parts[1].lower()
+            
+            if env not in clusters:
+                return {
+                    'statusCode': 404,
+                    'headers': {
+                        'Content-Type': 'application/json',
+                        'Access-Control-Allow-Origin': '*'
+                    },
+                    'body': json.dumps({
+                        'status': 'error',
+                        'error': {
+                            'type': 'InvalidEnvironment',
+                            'message': f"Environment '{env}' not supported"
+                        }
+                    })
+                }
+            
+            index, cached_time, errors = get_deployments_for_env(env, clusters)
+            
+            if path_parts[2] == 'namespaces':
+                data = {
+                    'namespaces': index.namespaces,
+                    'clusters': index.cluster_namespaces
+                }
+            else:
+                repository = '/'.join(path_parts[3:])
+                params = event.get('queryStringParameters') or {}
+                data = {
+                    'repository': repository,
+                    'versions': index.image_versions(repository, params.get('version'))
+                }
             
             return {
                 'statusCode': 200,
@@ -298,9 +1548,10 @@ def lambda_handler(event, context):
                 },
                 'body': json.dumps({
                     'status': 'success',
-                    'data': all_deployments,
+                    'data': data,
+                    'errors': errors,
                     'date_time': cached_time
-                })
+                }, default=to_json_value)
             }
             
         if len(path_parts) == 4 and path_parts[1] == 'cache' and path_parts[2] == 'refresh' and http_method == 'POST':
@@ -322,7 +1573,7 @@ def lambda_handler(event, context):
                     })
                 }
                 
-            all_deployments, cached_time = get_deployments_for_env(env, clusters, refresh_cache=True)
+            index, cached_time, errors = get_deployments_for_env(env, clusters, refresh_cache=True)
             
             return {
                 'statusCode': 200,
@@ -332,9 +1583,10 @@ def lambda_handler(event, context):
                 },
                 'body': json.dumps({
                     'status': 'success',
-                    'data': all_deployments,
+                    'data': index.deployments,
+                    'errors': errors,
                     'date_time': cached_time
-                })
+                }, default=to_json_value)
             }
             
         return {
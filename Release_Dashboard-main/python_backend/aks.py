@@ -1,16 +1,43 @@
-from flask import Flask, jsonify
-from kubernetes import client
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+import json
+import hashlib
+from kubernetes import client, watch
+from kubernetes.client.rest import ApiException
 import urllib3
-import re
 from flask_cors import CORS
 import os
-from functools import wraps
-from collections import defaultdict, namedtuple
+import queue
+import sqlite3
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import defaultdict, namedtuple, OrderedDict, deque
+import random
+import sys
 import time
+import threading
+import gzip
 from datetime import datetime, date
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import redis
+    from redis.backoff import NoBackoff
+    from redis.retry import Retry
+except ImportError:
+    redis = None
+
 app = Flask(__name__, static_folder='public')
-CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "OPTIONS", "POST"], "allow_headers": ["Content-Type"]}})
+CORS(app, resources={r"/api/*": {"origins": "*", "methods": ["GET", "OPTIONS", "POST"], "allow_headers": ["Content-Type", "If-None-Match"], "expose_headers": ["ETag"]}})
 
 CACHE_DURATIONS = {
     "poc": 120,
@@ -19,6 +46,13 @@ CACHE_DURATIONS = {
     "prod": 120
 }
 
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", 64 * 1024 * 1024))
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+REDIS_KEY_PREFIX = os.environ.get("REDIS_KEY_PREFIX", "release-dashboard")
+REDIS_STALE_INTERVALS = int(os.environ.get("REDIS_STALE_INTERVALS", 10))
+REDIS_TIMEOUT = float(os.environ.get("REDIS_TIMEOUT", 0.5))
+
 CLUSTERS = {
     "poc": {
         "minikube": {
@@ -38,171 +72,2206 @@ CLUSTERS = {
     }
 }
 
-VERSION_PATTERN = re.compile(r':([^:@]+)(?:@sha256:.+)?$')
+IMAGE_CACHE_SIZE = int(os.environ.get("IMAGE_CACHE_SIZE", 65536))
+
+DEPLOYMENT_COLLECTION_MODE = os.environ.get("DEPLOYMENT_COLLECTION_MODE", "cluster")
+DEPLOYMENT_PAGE_SIZE = int(os.environ.get("DEPLOYMENT_PAGE_SIZE", 500))
+DEPLOYMENT_FETCH_MODE = os.environ.get("DEPLOYMENT_FETCH_MODE", "raw")
+TABLE_ACCEPT_HEADER = "application/json;as=Table;g=meta.k8s.io;v=v1"
+
+CLUSTER_FETCH_CONCURRENCY = int(os.environ.get("CLUSTER_FETCH_CONCURRENCY", 8))
+CLUSTER_FETCH_TIMEOUT = float(os.environ.get("CLUSTER_FETCH_TIMEOUT", 30))
+CLUSTER_FETCH_ENV_LIMIT = int(os.environ.get("CLUSTER_FETCH_ENV_LIMIT", max(1, CLUSTER_FETCH_CONCURRENCY // len(CLUSTERS))))
+CLUSTER_WAIT_INTERVAL = 0.05
+
+NAMESPACE_FETCH_CONCURRENCY = int(os.environ.get("NAMESPACE_FETCH_CONCURRENCY", 16))
+NAMESPACE_FETCH_RETRIES = int(os.environ.get("NAMESPACE_FETCH_RETRIES", 5))
+K8S_CONNECTION_POOL_MAXSIZE = int(os.environ.get("K8S_CONNECTION_POOL_MAXSIZE", NAMESPACE_FETCH_CONCURRENCY + 2))
+
+DEPLOYMENT_WATCH_ENABLED = os.environ.get("DEPLOYMENT_WATCH_ENABLED", "true").lower() == "true"
+DEPLOYMENT_WATCH_TIMEOUT = int(os.environ.get("DEPLOYMENT_WATCH_TIMEOUT", 300))
+DEPLOYMENT_WATCH_MAX_FAILURES = int(os.environ.get("DEPLOYMENT_WATCH_MAX_FAILURES", 3))
+DEPLOYMENT_WATCH_STALE_AFTER = float(os.environ.get("DEPLOYMENT_WATCH_STALE_AFTER", DEPLOYMENT_WATCH_TIMEOUT * 2))
+
+CACHE_WARM_ENABLED = os.environ.get("CACHE_WARM_ENABLED", "true").lower() == "true"
+CACHE_WARM_LEAD = float(os.environ.get("CACHE_WARM_LEAD", 15))
+CACHE_WARM_JITTER = float(os.environ.get("CACHE_WARM_JITTER", 5))
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 500
+QUERY_CACHE_SIZE = 64
+CHANGE_LOG_SIZE = int(os.environ.get("CHANGE_LOG_SIZE", 500))
+SNAPSHOT_ENABLED = os.environ.get("SNAPSHOT_ENABLED", "true").lower() == "true"
+SNAPSHOT_PATH = os.environ.get("SNAPSHOT_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots.sqlite3"))
+HISTORY_ENABLED = os.environ.get("HISTORY_ENABLED", "true").lower() == "true"
+HISTORY_PATH = os.environ.get("HISTORY_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "history.sqlite3"))
+DEFAULT_HISTORY_LIMIT = 100
+MAX_HISTORY_LIMIT = 1000
+HISTORY_SCHEMA_VERSION = 1
+COMPRESSION_MIN_BYTES = 1024
+METRICS_PREFIX = os.environ.get("METRICS_PREFIX", "release_dashboard")
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+k8s_clients = {env: {} for env in CLUSTERS.keys()}
+
+deployment_informers = {env: {} for env in CLUSTERS.keys()}
+cluster_informers = {}
+cluster_informers_lock = threading.Lock()
+
+cache_warmers = {}
+
+env_indexes = {}
+env_indexes_lock = threading.Lock()
+
+drift_tables = OrderedDict()
+drift_tables_lock = threading.Lock()
+
+snapshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-save")
+snapshot_loaded = set()
+snapshot_sources = {}
+snapshot_lock = threading.Lock()
+
+history_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-record")
+
+env_revisions = defaultdict(int)
+revision_epoch = None
+env_baselines = defaultdict(dict)
+env_change_log = defaultdict(lambda: deque(maxlen=CHANGE_LOG_SIZE))
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+class ImageReference(namedtuple('ImageReference', ['registry', 'repository', 'tag', 'digest'])):
+    __slots__ = ()
+
+    @property
+    def name(self):
+        if self.registry:
+            return f"{self.registry}/{self.repository}"
+        return self.repository
+
+    @property
+    def version(self):
+        if self.tag:
+            return self.tag
+        if self.digest:
+            return self.digest.split(":", 1)[-1]
+        return "None"
+
+class ContainerImage(namedtuple('ContainerImage', ['image', 'version', 'reference', 'name'], defaults=[""])):
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
+    @property
+    def container(self):
+        return self.name or self.reference.name
+
+    def to_dict(self):
+        return {"image": self.image, "version": self.version}
+
+    def to_stored_dict(self):
+        return {"name": self.name, "image": self.image, "version": self.version}
+
+    def estimate_json_bytes(self):
+        return CONTAINER_JSON_OVERHEAD + len(self.image) + len(self.version)
+
+class DeploymentRecord:
+    __slots__ = ("name", "namespace", "cluster", "main_containers", "init_containers")
+
+    FIELDS = {
+        "deployment-name": "name",
+        "namespace": "namespace",
+        "cluster": "cluster",
+        "main-containers": "main_containers",
+        "init-containers": "init_containers"
+    }
+
+    def __init__(self, name, namespace, cluster, main_containers, init_containers):
+        self.name = sys.intern(name)
+        self.namespace = sys.intern(namespace)
+        self.cluster = sys.intern(cluster)
+        self.main_containers = main_containers
+        self.init_containers = init_containers
+
+    def __getitem__(self, key):
+        return getattr(self, self.FIELDS[key])
+
+    def __eq__(self, other):
+        return isinstance(other, DeploymentRecord) and all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    __hash__ = None
+
+    @classmethod
+    def from_dict(cls, info):
+        return cls(
+            info["deployment-name"],
+            info["namespace"],
+            info["cluster"],
+            get_container_images(
+                [container["image"] for container in info["main-containers"]],
+                [container.get("name", "") for container in info["main-containers"]]
+            ),
+            get_container_images(
+                [container["image"] for container in info["init-containers"]],
+                [container.get("name", "") for container in info["init-containers"]]
+            )
+        )
+
+    def to_dict(self):
+        return {
+            "deployment-name": self.name,
+            "namespace": self.namespace,
+            "cluster": self.cluster,
+            "main-containers": [container.to_dict() for container in self.main_containers],
+            "init-containers": [container.to_dict() for container in self.init_containers]
+        }
+
+    def estimate_json_bytes(self):
+        return (
+            RECORD_JSON_OVERHEAD + len(self.name) + len(self.namespace) + len(self.cluster)
+            + sum(container.estimate_json_bytes() for container in self.main_containers)
+            + sum(container.estimate_json_bytes() for container in self.init_containers)
+        )
+
+    def to_stored_dict(self):
+        return {
+            **self.to_dict(),
+            "main-containers": [container.to_stored_dict() for container in self.main_containers],
+            "init-containers": [container.to_stored_dict() for container in self.init_containers]
+        }
+
+def to_json_value(value):
+    if isinstance(value, (DeploymentRecord, ContainerImage)):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def to_stored_json_value(value):
+    if isinstance(value, (DeploymentRecord, ContainerImage)):
+        return value.to_stored_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+CONTAINER_JSON_OVERHEAD = len(json.dumps({"image": "", "version": ""})) + 2
+RECORD_JSON_OVERHEAD = len(json.dumps(DeploymentRecord("", "", "", (), ()), default=to_json_value)) + 2
+
+def estimate_result_bytes(result):
+    records = result.get("data") or ()
+    summary = {key: value for key, value in result.items() if key != "data"}
+    return len(json.dumps(summary, default=str)) + sum(record.estimate_json_bytes() for record in records)
+
+class RecordJSONProvider(DefaultJSONProvider):
+    @staticmethod
+    def default(value):
+        if isinstance(value, (DeploymentRecord, ContainerImage)):
+            return value.to_dict()
+        return DefaultJSONProvider.default(value)
+
+app.json = RecordJSONProvider(app)
+
+def format_metric_labels(label_pairs):
+    if not label_pairs:
+        return ""
+    escaped = [
+        (name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in label_pairs
+    ]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+def format_metric_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class MetricsRegistry:
+    def __init__(self, prefix=METRICS_PREFIX):
+        self.prefix = prefix
+        self.definitions = OrderedDict()
+        self.values = defaultdict(dict)
+        self.lock = threading.Lock()
+
+    def define(self, name, metric_type, help_text, label_names=(), buckets=None):
+        self.definitions[name] = (metric_type, help_text, label_names, buckets)
+
+    def inc(self, name, labels=(), amount=1):
+        with self.lock:
+            self.values[name][labels] = self.values[name].get(labels, 0) + amount
+
+    def set(self, name, labels, value):
+        with self.lock:
+            self.values[name][labels] = value
+
+    def observe(self, name, labels, value):
+        buckets = self.definitions[name][3]
+        with self.lock:
+            histogram = self.values[name].get(labels)
+            if histogram is None:
+                histogram = self.values[name][labels] = [[0] * len(buckets), 0.0, 0]
+            for position, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[0][position] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def render(self):
+        lines = []
+        with self.lock:
+            for name, (metric_type, help_text, label_names, buckets) in self.definitions.items():
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# HELP {full_name} {help_text}")
+                lines.append(f"# TYPE {full_name} {metric_type}")
+                for labels, value in sorted(self.values[name].items()):
+                    label_pairs = list(zip(label_names, labels))
+                    if metric_type != "histogram":
+                        lines.append(f"{full_name}{format_metric_labels(label_pairs)} {format_metric_value(value)}")
+                        continue
+
+                    counts, total, count = value
+                    for bound, bucket_count in zip(buckets, counts):
+                        lines.append(f"{full_name}_bucket{format_metric_labels(label_pairs + [('le', format_metric_value(bound))])} {bucket_count}")
+                    lines.append(f"{full_name}_bucket{format_metric_labels(label_pairs + [('le', '+Inf')])} {count}")
+                    lines.append(f"{full_name}_sum{format_metric_labels(label_pairs)} {format_metric_value(total)}")
+                    lines.append(f"{full_name}_count{format_metric_labels(label_pairs)} {count}")
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+metrics.define("cluster_sweep_seconds", "histogram", "Time to list every deployment in a cluster", ("env", "cluster", "status"), LATENCY_BUCKETS)
+metrics.define("cluster_sweep_deployments", "gauge", "Deployments returned by the last cluster sweep", ("env", "cluster"))
+metrics.define("cluster_sweep_namespaces", "gauge", "Namespaces holding deployments in the last cluster sweep", ("env", "cluster"))
+metrics.define("k8s_api_request_seconds", "histogram", "Kubernetes API call latency including the response body read", ("cluster", "operation", "status"), LATENCY_BUCKETS)
+metrics.define("k8s_api_throttled_total", "counter", "Kubernetes API calls rejected with 429 Too Many Requests", ("cluster",))
+metrics.define("namespace_fetch_seconds", "gauge", "Duration of the last deployment fetch per namespace, retries included", ("cluster", "namespace"))
+metrics.define("response_serialization_seconds", "histogram", "Time to serialize or compress a response body", ("encoding",), LATENCY_BUCKETS)
+metrics.define("cache_hits_total", "counter", "Cluster lookups served from a fresh cache entry", ("env",))
+metrics.define("cache_stale_hits_total", "counter", "Cluster lookups served from a stale cache entry", ("env",))
+metrics.define("cache_misses_total", "counter", "Cluster lookups that had to sweep the cluster", ("env",))
+metrics.define("cache_hit_ratio", "gauge", "Share of cluster lookups served from cache", ("env",))
+metrics.define("cache_entries", "gauge", "Cluster results held in the local cache", ("env",))
+metrics.define("cache_bytes", "gauge", "Approximate size of the local cache", ("env",))
+metrics.define("cache_refresh_in_flight", "gauge", "Cluster refreshes currently running", ("env", "cluster"))
+
+class EnvironmentCache:
+    def __init__(self, maxsize=256, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.cache = defaultdict(OrderedDict)
+        self.entry_bytes = defaultdict(dict)
+        self.cache_info_data = defaultdict(lambda: {"hits": 0, "misses": 0, "stale_hits": 0, "bytes": 0})
+        self.last_access_time = defaultdict(float)
+        self.latest_keys = defaultdict(dict)
+        self.env_locks = {}
+        self.refresh_locks = {}
+        self.locks_guard = threading.Lock()
+
+    def get_env_lock(self, env):
+        with self.locks_guard:
+            return self.env_locks.setdefault(env, threading.RLock())
+
+    def get_refresh_lock(self, env, cluster_name):
+        with self.locks_guard:
+            return self.refresh_locks.setdefault((env, cluster_name), threading.Lock())
+
+    def get_cache_timestamp(self, env, current_time=None):
+        if current_time is None:
+            current_time = time.time()
+        
+        with self.get_env_lock(env):
+            if not self.last_access_time[env]:
+                self.last_access_time[env] = current_time
+                return current_time
+            
+            time_elapsed = current_time - self.last_access_time[env]
+            duration = CACHE_DURATIONS[env]
+            intervals = int(time_elapsed / duration)
+            
+            return self.last_access_time[env] + (intervals * duration)
+
+    def cache_info(self):
+        with self.locks_guard:
+            envs = list(self.env_locks.keys())
+        infos = [self.env_cache_info(env) for env in envs]
+        return CacheInfo(
+            sum(info.hits for info in infos),
+            sum(info.misses for info in infos),
+            self.maxsize,
+            sum(info.currsize for info in infos)
+        )
+
+    def env_cache_info(self, env):
+        with self.get_env_lock(env):
+            info = self.cache_info_data[env]
+            return CacheInfo(info["hits"], info["misses"], self.maxsize, len(self.cache.get(env, {})))
+
+    def env_cache_stats(self, env):
+        with self.get_env_lock(env):
+            return {**self.cache_info_data[env], "currsize": len(self.cache.get(env, {}))}
+
+    def cache_clear(self, env=None):
+        if env is None:
+            with self.locks_guard:
+                envs = list(self.env_locks.keys())
+            for cached_env in envs:
+                self.cache_clear(cached_env)
+            return
+
+        with self.get_env_lock(env):
+            self.cache.pop(env, None)
+            self.entry_bytes.pop(env, None)
+            self.cache_info_data.pop(env, None)
+            self.last_access_time.pop(env, None)
+            self.latest_keys.pop(env, None)
+
+    def evict(self, env, cache_key):
+        self.cache[env].pop(cache_key, None)
+        self.cache_info_data[env]["bytes"] -= self.entry_bytes[env].pop(cache_key, 0)
+        if self.latest_keys[env].get(cache_key[0]) == cache_key:
+            del self.latest_keys[env][cache_key[0]]
+
+    def contains(self, env, cache_key):
+        with self.get_env_lock(env):
+            return cache_key in self.cache[env]
+
+    def get(self, env, cache_key):
+        with self.get_env_lock(env):
+            result = self.cache[env].get(cache_key)
+            if result is not None:
+                self.cache[env].move_to_end(cache_key)
+                self.cache_info_data[env]["hits"] += 1
+            return result
+
+    def get_stale(self, env, cluster_name):
+        with self.get_env_lock(env):
+            stale_key = self.latest_keys[env].get(cluster_name)
+            if stale_key is None:
+                return None
+            self.cache[env].move_to_end(stale_key)
+            self.cache_info_data[env]["stale_hits"] += 1
+            return self.cache[env][stale_key]
+
+    def get_prewarmed(self, env, cluster_name, timestamp):
+        with self.get_env_lock(env):
+            latest_key = self.latest_keys[env].get(cluster_name)
+            if latest_key is None or latest_key[1] < timestamp:
+                return None
+            self.cache[env].move_to_end(latest_key)
+            self.cache_info_data[env]["hits"] += 1
+            return self.cache[env][latest_key]
+
+    def store(self, env, cluster_name, cache_key, result):
+        size = estimate_result_bytes(result)
+        with self.get_env_lock(env):
+            previous_key = self.latest_keys[env].get(cluster_name)
+            if previous_key is not None:
+                if previous_key[1] > cache_key[1]:
+                    return
+                if result.get("status") != "success" and self.cache[env][previous_key].get("status") == "success":
+                    return
+                if previous_key != cache_key:
+                    self.evict(env, previous_key)
+
+            self.evict(env, cache_key)
+            self.cache[env][cache_key] = result
+            self.entry_bytes[env][cache_key] = size
+            self.cache_info_data[env]["bytes"] += size
+            self.latest_keys[env][cluster_name] = cache_key
+            
+            while len(self.cache[env]) > 1 and (
+                len(self.cache[env]) > self.maxsize
+                or (self.max_bytes and self.cache_info_data[env]["bytes"] > self.max_bytes)
+            ):
+                self.evict(env, next(iter(self.cache[env])))
+
+    def load(self, func, cluster_name, env, timestamp):
+        cache_key = (cluster_name, timestamp)
+        result = self.get(env, cache_key)
+        if result is not None:
+            return result
+
+        with self.get_env_lock(env):
+            self.cache_info_data[env]["misses"] += 1
+        metrics.inc("cache_refresh_in_flight", (env, cluster_name))
+        try:
+            result = func(cluster_name, env, timestamp)
+        finally:
+            metrics.inc("cache_refresh_in_flight", (env, cluster_name), -1)
+        self.store(env, cluster_name, cache_key, result)
+        return result
+
+    def refresh(self, func, cluster_name, env, timestamp):
+        with self.get_refresh_lock(env, cluster_name):
+            return self.load(func, cluster_name, env, timestamp)
+
+    def try_refresh(self, func, cluster_name, env, timestamp):
+        lock = self.get_refresh_lock(env, cluster_name)
+        if not lock.acquire(blocking=False):
+            return None
+        try:
+            return self.load(func, cluster_name, env, timestamp)
+        finally:
+            lock.release()
+
+    def refresh_in_background(self, func, cluster_name, env, timestamp):
+        lock = self.get_refresh_lock(env, cluster_name)
+        if not lock.acquire(blocking=False):
+            return
+
+        def run():
+            try:
+                cache_key = (cluster_name, timestamp)
+                if self.contains(env, cache_key):
+                    return
+                with self.get_env_lock(env):
+                    self.cache_info_data[env]["misses"] += 1
+                metrics.inc("cache_refresh_in_flight", (env, cluster_name))
+                try:
+                    result = func(cluster_name, env, timestamp)
+                finally:
+                    metrics.inc("cache_refresh_in_flight", (env, cluster_name), -1)
+                self.store(env, cluster_name, cache_key, result)
+            finally:
+                lock.release()
+
+        threading.Thread(target=run, name=f"cache-refresh-{env}-{cluster_name}", daemon=True).start()
+
+    def lookup(self, func, cluster_name, env, timestamp):
+        result = self.get(env, (cluster_name, timestamp))
+        if result is not None:
+            return result
+
+        result = self.get_prewarmed(env, cluster_name, timestamp)
+        if result is not None:
+            return result
+
+        stale_result = self.get_stale(env, cluster_name)
+        if stale_result is not None:
+            self.refresh_in_background(func, cluster_name, env, timestamp)
+            return {**stale_result, "stale": True}
+        return None
+
+    def __call__(self, func):
+        @wraps(func)
+        def wrapper(cluster_name, env, timestamp):
+            result = self.lookup(func, cluster_name, env, timestamp)
+            if result is not None:
+                return result
+            return self.refresh(func, cluster_name, env, timestamp)
+        return wrapper
+
+class SnapshotStore:
+    def __init__(self, path):
+        self.path = path
+        self.connection = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "env TEXT NOT NULL, cluster TEXT NOT NULL, timestamp REAL NOT NULL, "
+                "resource_version TEXT, saved_at REAL NOT NULL, payload BLOB NOT NULL, "
+                "PRIMARY KEY (env, cluster))"
+            )
+        return self.connection
+
+    def save(self, env, cluster_name, timestamp, result):
+        payload = gzip.compress(dumps_stored_json(result), compresslevel=1)
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?)",
+                    (env, cluster_name, timestamp, result.get("resource_version"), time.time(), payload)
+                )
+
+    def load(self, env):
+        with self.lock:
+            rows = self.connect().execute(
+                "SELECT cluster, timestamp, payload FROM snapshots WHERE env = ?", (env,)
+            ).fetchall()
+
+        snapshots = {}
+        for cluster_name, timestamp, payload in rows:
+            result = loads_json(gzip.decompress(payload))
+            result["data"] = [DeploymentRecord.from_dict(info) for info in result["data"]]
+            snapshots[cluster_name] = (timestamp, result)
+        return snapshots
+
+    def resource_versions(self, env):
+        with self.lock:
+            rows = self.connect().execute(
+                "SELECT cluster, timestamp, resource_version, saved_at FROM snapshots WHERE env = ?", (env,)
+            ).fetchall()
+        return {
+            cluster_name: {"timestamp": timestamp, "resource_version": resource_version, "saved_at": saved_at}
+            for cluster_name, timestamp, resource_version, saved_at in rows
+        }
+
+    def delete(self, env=None):
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                if env is None:
+                    connection.execute("DELETE FROM snapshots")
+                else:
+                    connection.execute("DELETE FROM snapshots WHERE env = ?", (env,))
+
+class HistoryStore:
+    def __init__(self, path):
+        self.path = path
+        self.connection = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+        if self.connection is None:
+            self.connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                "ts INTEGER NOT NULL, env TEXT NOT NULL, cluster TEXT NOT NULL, namespace TEXT NOT NULL, "
+                "deployment TEXT NOT NULL, container TEXT NOT NULL, old TEXT, new TEXT)"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS history_deployment ON history (env, deployment, ts)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS history_time ON history (env, ts)")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS history_state ("
+                "env TEXT NOT NULL, cluster TEXT NOT NULL, namespace TEXT NOT NULL, deployment TEXT NOT NULL, "
+                "container TEXT NOT NULL, version TEXT NOT NULL, "
+                "PRIMARY KEY (env, cluster, namespace, deployment, container)) WITHOUT ROWID"
+            )
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] < HISTORY_SCHEMA_VERSION:
+                with self.connection:
+                    self.connection.execute("DELETE FROM history_state")
+                    self.connection.execute(f"PRAGMA user_version = {HISTORY_SCHEMA_VERSION}")
+        return self.connection
+
+    def record(self, env, clusters, deployments, timestamp=None):
+        if timestamp is None:
+            timestamp = int(time.time())
+        if not clusters:
+            return 0
+
+        current = {}
+        for deployment in deployments:
+            for container, version in get_container_versions(deployment).items():
+                current[(deployment["cluster"], deployment["namespace"], deployment["deployment-name"], container)] = version
+
+        with self.lock:
+            connection = self.connect()
+            with connection:
+                connection.execute("BEGIN IMMEDIATE")
+                rows = connection.execute(
+                    f"SELECT cluster, namespace, deployment, container, version FROM history_state "
+                    f"WHERE env = ? AND cluster IN ({', '.join('?' * len(clusters))})",
+                    (env, *clusters)
+                ).fetchall()
+                previous = {tuple(row[:4]): row[4] for row in rows}
+                known_clusters = {row[0] for row in rows}
+
+                transitions = [
+                    (timestamp, env, *key, previous.get(key), version)
+                    for key, version in current.items()
+                    if key[0] in known_clusters and previous.get(key) != version
+                ]
+                removed = [key for key in previous if key not in current]
+                transitions.extend((timestamp, env, *key, previous[key], None) for key in removed)
+
+                connection.executemany("INSERT INTO history VALUES (?, ?, ?, ?, ?, ?, ?, ?)", transitions)
+                connection.executemany(
+                    "DELETE FROM history_state WHERE env = ? AND cluster = ? AND namespace = ? AND deployment = ? AND container = ?",
+                    [(env, *key) for key in removed]
+                )
+                connection.executemany(
+                    "INSERT OR REPLACE INTO history_state VALUES (?, ?, ?, ?, ?, ?)",
+                    [(env, *key, version) for key, version in current.items() if previous.get(key) != version]
+                )
+        return len(transitions)
+
+    def query(self, env, filters, since=None, until=None, before=None, limit=DEFAULT_HISTORY_LIMIT):
+        clauses = ["env = ?"]
+        params = [env]
+        for column, value in filters.items():
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        if before is not None:
+            clauses.append("rowid < ?")
+            params.append(before)
+
+        with self.lock:
+            rows = self.connect().execute(
+                f"SELECT rowid, ts, cluster, namespace, deployment, container, old, new FROM history "
+                f"WHERE {' AND '.join(clauses)} ORDER BY ts DESC, rowid DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+
+        return [{
+            "id": row_id,
+            "timestamp": ts,
+            "date_time": datetime.fromtimestamp(ts).strftime("%d-%m-%Y %I:%M %p"),
+            "cluster": cluster_name,
+            "namespace": namespace,
+            "deployment-name": deployment,
+            "container": container,
+            "old": old,
+            "new": new
+        } for row_id, ts, cluster_name, namespace, deployment, container, old, new in rows]
+
+class RedisRefreshLock:
+    def __init__(self, lock, fallback):
+        self.lock = lock
+        self.fallback = fallback
+        self.held = None
+
+    def acquire(self, blocking=True):
+        try:
+            self.held = self.lock
+            return self.lock.acquire(blocking=blocking)
+        except redis.exceptions.RedisError:
+            self.held = self.fallback
+            return self.fallback.acquire(blocking)
+
+    def release(self):
+        try:
+            self.held.release()
+        except redis.exceptions.RedisError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+class RedisEnvironmentCache(EnvironmentCache):
+    def __init__(self, redis_client, maxsize=256, max_bytes=None, prefix=REDIS_KEY_PREFIX):
+        super().__init__(maxsize, max_bytes)
+        self.redis = redis_client
+        self.prefix = prefix
+
+    def get_key(self, env, *parts):
+        return ":".join([self.prefix, env, *map(str, parts)])
+
+    def get_refresh_lock(self, env, cluster_name):
+        lock = self.redis.lock(
+            self.get_key(env, cluster_name, "lock"),
+            timeout=CLUSTER_FETCH_TIMEOUT * 2,
+            sleep=0.05,
+            thread_local=False,
+            raise_on_release_error=False
+        )
+        return RedisRefreshLock(lock, super().get_refresh_lock(env, cluster_name))
+
+    def get_cache_timestamp(self, env, current_time=None):
+        if current_time is None:
+            current_time = time.time()
+
+        try:
+            anchor_key = self.get_key(env, "anchor")
+            self.redis.set(anchor_key, repr(current_time), nx=True)
+            anchor = float(self.redis.get(anchor_key))
+        except redis.exceptions.RedisError:
+            return super().get_cache_timestamp(env, current_time)
+
+        with self.get_env_lock(env):
+            self.last_access_time[env] = anchor
+        duration = CACHE_DURATIONS[env]
+        return anchor + int((current_time - anchor) / duration) * duration
+
+    def contains(self, env, cache_key):
+        if super().contains(env, cache_key):
+            return True
+        try:
+            return bool(self.redis.exists(self.get_key(env, *cache_key)))
+        except redis.exceptions.RedisError:
+            return False
+
+    def get(self, env, cache_key):
+        result = super().get(env, cache_key)
+        if result is not None:
+            return result
+
+        try:
+            payload = self.redis.get(self.get_key(env, *cache_key))
+        except redis.exceptions.RedisError:
+            return None
+        if payload is None:
+            return None
+
+        result = loads_json(payload)
+        result["data"] = [DeploymentRecord.from_dict(info) for info in result["data"]]
+        with self.get_env_lock(env):
+            if cache_key in self.cache[env]:
+                return super().get(env, cache_key)
+            super().store(env, cache_key[0], cache_key, result)
+            self.cache_info_data[env]["hits"] += 1
+        return result
+
+    def get_stale(self, env, cluster_name):
+        result = super().get_stale(env, cluster_name)
+        if result is not None:
+            return result
+
+        try:
+            latest = self.redis.get(self.get_key(env, cluster_name, "latest"))
+        except redis.exceptions.RedisError:
+            return None
+        if latest is None:
+            return None
+        return self.get(env, (cluster_name, float(latest)))
+
+    def store(self, env, cluster_name, cache_key, result):
+        super().store(env, cluster_name, cache_key, result)
+        if result.get("status") != "success":
+            return
+
+        ttl = int(CACHE_DURATIONS[env] * REDIS_STALE_INTERVALS)
+        try:
+            pipeline = self.redis.pipeline()
+            pipeline.set(self.get_key(env, *cache_key), dumps_stored_json(result), ex=ttl)
+            pipeline.set(self.get_key(env, cluster_name, "latest"), repr(cache_key[1]), ex=ttl)
+            pipeline.execute()
+        except redis.exceptions.RedisError:
+            pass
+
+    def cache_clear(self, env=None):
+        super().cache_clear(env)
+        try:
+            pattern = self.get_key(env, "*") if env else f"{self.prefix}:*"
+            keys = list(self.redis.scan_iter(match=pattern))
+            if keys:
+                self.redis.delete(*keys)
+        except redis.exceptions.RedisError:
+            pass
+
+def create_cluster_cache():
+    if CACHE_BACKEND == "redis":
+        if redis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the redis package")
+        redis_client = redis.Redis.from_url(
+            REDIS_URL,
+            socket_timeout=REDIS_TIMEOUT,
+            socket_connect_timeout=REDIS_TIMEOUT,
+            retry=Retry(NoBackoff(), 1)
+        )
+        return RedisEnvironmentCache(redis_client, maxsize=256, max_bytes=CACHE_MAX_BYTES)
+    return EnvironmentCache(maxsize=256, max_bytes=CACHE_MAX_BYTES)
+
+cluster_cache = create_cluster_cache()
+
+snapshot_store = SnapshotStore(SNAPSHOT_PATH) if SNAPSHOT_ENABLED else None
+
+history_store = HistoryStore(HISTORY_PATH) if HISTORY_ENABLED else None
+
+class AdaptiveConcurrencyLimiter:
+    def __init__(self, max_limit, min_limit=1):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.limit = float(max_limit)
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled=False):
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.min_limit, self.limit / 2)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+cluster_executor = ThreadPoolExecutor(max_workers=CLUSTER_FETCH_CONCURRENCY, thread_name_prefix="cluster-fetch")
+cluster_fetch_slots = {env: threading.BoundedSemaphore(CLUSTER_FETCH_ENV_LIMIT) for env in CLUSTERS.keys()}
+
+def get_formatted_time():
+    return datetime.now().strftime("%I:%M %p")
+
+def get_formatted_date():
+    return datetime.now().strftime("%d-%m-%Y")
+
+def initialize_k8s_clients(env):
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    for cluster_name, cluster_info in CLUSTERS[env].items():
+        configuration = client.Configuration()
+        configuration.host = cluster_info["host"]
+        configuration.verify_ssl = False
+        configuration.api_key = {"authorization": f"Bearer {cluster_info['token']}"}
+        configuration.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
+        
+        api_client = client.ApiClient(configuration)
+        k8s_clients[env][cluster_name] = {
+            "apps_v1": client.AppsV1Api(api_client),
+            "core_v1": client.CoreV1Api(api_client),
+            "limiter": AdaptiveConcurrencyLimiter(NAMESPACE_FETCH_CONCURRENCY)
+        }
+
+    if DEPLOYMENT_WATCH_ENABLED:
+        start_informers(env)
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def parse_image_reference(image_string):
+    name, _, digest = image_string.partition("@")
+    tag = None
+    if name.rfind(":") > name.rfind("/"):
+        name, tag = name.rsplit(":", 1)
+    registry = None
+    first, separator, remainder = name.partition("/")
+    if separator and ("." in first or ":" in first or first == "localhost"):
+        registry, name = first, remainder
+    return ImageReference(
+        sys.intern(registry) if registry else None,
+        sys.intern(name),
+        sys.intern(tag) if tag else None,
+        sys.intern(digest) if digest else None
+    )
+
+def extract_version_from_image(image_string):
+    return parse_image_reference(image_string).version
+
+def extract_repository_from_image(image_string):
+    return parse_image_reference(image_string).name
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def get_container_image(image, name=""):
+    reference = parse_image_reference(image)
+    return ContainerImage(sys.intern(image), sys.intern(reference.version), reference, sys.intern(name))
+
+def get_container_images(images, names=None):
+    if names is None:
+        return tuple(map(get_container_image, images))
+    return tuple(map(get_container_image, images, names))
+
+def process_container_images(containers):
+    if not containers:
+        return ()
+    return get_container_images([container.image for container in containers], [container.name or "" for container in containers])
+
+def get_cache_timestamp(env):
+    return cluster_cache.get_cache_timestamp(env)
+
+@cluster_cache
+def get_cluster_info_cached(cluster_name, env, timestamp):
+    return get_cluster_info(cluster_name, env, CACHE_DURATIONS[env], timestamp)
+
+def build_deployment_info(deployment, cluster_name):
+    pod_spec = deployment.spec.template.spec
+    return DeploymentRecord(
+        deployment.metadata.name,
+        deployment.metadata.namespace,
+        cluster_name,
+        process_container_images(pod_spec.containers),
+        process_container_images(pod_spec.init_containers)
+    )
+
+def process_raw_container_images(containers):
+    if not containers:
+        return ()
+    return get_container_images(
+        [container.get("image") or "" for container in containers],
+        [container.get("name") or "" for container in containers]
+    )
+
+def build_raw_deployment_info(item, cluster_name):
+    pod_spec = item["spec"]["template"]["spec"]
+    return DeploymentRecord(
+        item["metadata"]["name"],
+        item["metadata"]["namespace"],
+        cluster_name,
+        process_raw_container_images(pod_spec.get("containers")),
+        process_raw_container_images(pod_spec.get("initContainers"))
+    )
+
+def build_table_deployment_infos(table, cluster_name):
+    columns = [column["name"] for column in table["columnDefinitions"]]
+    images_column = columns.index("Images")
+    containers_column = columns.index("Containers") if "Containers" in columns else None
+    infos = []
+    for row in table.get("rows") or []:
+        metadata = row["object"]["metadata"]
+        images = [image for image in row["cells"][images_column].split(",") if image]
+        names = None
+        if containers_column is not None:
+            names = [name for name in row["cells"][containers_column].split(",") if name]
+            if len(names) != len(images):
+                names = None
+        infos.append(DeploymentRecord(
+            metadata["name"],
+            metadata["namespace"],
+            cluster_name,
+            get_container_images(images, names),
+            ()
+        ))
+    return infos
+
+def loads_json(payload):
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+def call_k8s_api(cluster_name, operation, call, *args, **kwargs):
+    started = time.perf_counter()
+    status = "200"
+    try:
+        return call(*args, **kwargs)
+    except ApiException as e:
+        status = str(e.status)
+        raise
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        metrics.observe("k8s_api_request_seconds", (cluster_name, operation, status), time.perf_counter() - started)
+
+def read_raw_response(list_call, *args, **kwargs):
+    response = list_call(*args, _preload_content=False, **kwargs)
+    try:
+        return response.data
+    finally:
+        response.release_conn()
+
+def list_deployment_page(list_call, cluster_name, *args, **kwargs):
+    operation = list_call.__name__
+    if DEPLOYMENT_FETCH_MODE == "model":
+        page = call_k8s_api(cluster_name, operation, list_call, *args, **kwargs)
+        infos = [build_deployment_info(deployment, cluster_name) for deployment in page.items]
+        return infos, page.metadata._continue, page.metadata.resource_version
+
+    if DEPLOYMENT_FETCH_MODE == "table":
+        kwargs["_headers"] = {"Accept": TABLE_ACCEPT_HEADER}
+    body = loads_json(call_k8s_api(cluster_name, operation, read_raw_response, list_call, *args, **kwargs))
+
+    if body.get("kind") == "Table":
+        infos = build_table_deployment_infos(body, cluster_name)
+    else:
+        infos = [build_raw_deployment_info(item, cluster_name) for item in body.get("items") or []]
+    metadata = body.get("metadata") or {}
+    return infos, metadata.get("continue"), metadata.get("resourceVersion")
+
+def iter_cluster_deployment_pages(clients, cluster_name, with_resource_version=False):
+    continue_token = None
+    while True:
+        kwargs = {"limit": DEPLOYMENT_PAGE_SIZE}
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        infos, continue_token, resource_version = list_deployment_page(
+            clients["apps_v1"].list_deployment_for_all_namespaces,
+            cluster_name,
+            _request_timeout=CLUSTER_FETCH_TIMEOUT,
+            **kwargs
+        )
+        yield (infos, resource_version) if with_resource_version else infos
+        if not continue_token:
+            break
+
+def get_retry_delay(exception, attempt):
+    retry_after = (exception.headers or {}).get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return int(retry_after)
+    return min(0.5 * (2 ** attempt), 10)
+
+def list_namespace_deployments(clients, cluster_name, namespace_name):
+    limiter = clients["limiter"]
+    started = time.perf_counter()
+    try:
+        for attempt in range(NAMESPACE_FETCH_RETRIES + 1):
+            throttled = False
+            limiter.acquire()
+            try:
+                infos, _, _ = list_deployment_page(
+                    clients["apps_v1"].list_namespaced_deployment,
+                    cluster_name,
+                    namespace_name,
+                    _request_timeout=CLUSTER_FETCH_TIMEOUT
+                )
+                return infos
+            except ApiException as e:
+                if e.status != 429:
+                    raise
+                metrics.inc("k8s_api_throttled_total", (cluster_name,))
+                if attempt == NAMESPACE_FETCH_RETRIES:
+                    raise
+                throttled = True
+                delay = get_retry_delay(e, attempt)
+            finally:
+                limiter.release(throttled)
+            time.sleep(delay)
+    finally:
+        metrics.set("namespace_fetch_seconds", (cluster_name, namespace_name), time.perf_counter() - started)
+
+def iter_namespaced_deployment_pages(clients, cluster_name):
+    namespaces = call_k8s_api(cluster_name, "list_namespace", clients["core_v1"].list_namespace, _request_timeout=CLUSTER_FETCH_TIMEOUT)
+    namespace_names = [ns.metadata.name for ns in namespaces.items]
+    with ThreadPoolExecutor(max_workers=NAMESPACE_FETCH_CONCURRENCY, thread_name_prefix="namespace-fetch") as executor:
+        yield from executor.map(lambda namespace_name: list_namespace_deployments(clients, cluster_name, namespace_name), namespace_names)
+
+def iter_deployment_pages(clients, cluster_name):
+    if DEPLOYMENT_COLLECTION_MODE == "namespaced":
+        yield from ((infos, None) for infos in iter_namespaced_deployment_pages(clients, cluster_name))
+        return
+
+    pages = iter_cluster_deployment_pages(clients, cluster_name, with_resource_version=True)
+    try:
+        first_page = next(pages, ([], None))
+    except ApiException as e:
+        if e.status != 403:
+            raise
+        yield from ((infos, None) for infos in iter_namespaced_deployment_pages(clients, cluster_name))
+        return
+
+    yield first_page
+    yield from pages
+
+def get_cluster_info(cluster_name, env, cache_duration, cache_timestamp, on_page=None):
+    started = time.perf_counter()
+    try:
+        if cluster_name not in k8s_clients[env]:
+            return {
+                "status": "error",
+                "error": {
+                    "type": "ClusterNotFound",
+                    "message": f"Cluster '{cluster_name}' not found in {env} environment"
+                }
+            }
+        
+        clients = k8s_clients[env][cluster_name]
+        cluster_info = []
+        resource_version = None
+        current_time = get_formatted_time()
+        current_date = get_formatted_date()
+        
+        for deployments, page_resource_version in iter_deployment_pages(clients, cluster_name):
+            resource_version = resource_version or page_resource_version
+            cluster_info.extend(deployments)
+            if on_page:
+                on_page(deployments)
+
+        metrics.observe("cluster_sweep_seconds", (env, cluster_name, "success"), time.perf_counter() - started)
+        metrics.set("cluster_sweep_deployments", (env, cluster_name), len(cluster_info))
+        metrics.set("cluster_sweep_namespaces", (env, cluster_name), len({deployment["namespace"] for deployment in cluster_info}))
+        
+        return {"status": "success", "data": cluster_info, "resource_version": resource_version, "time": current_time, "date": current_date}
+
+    except Exception as e:
+        metrics.observe("cluster_sweep_seconds", (env, cluster_name, "error"), time.perf_counter() - started)
+        return {
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            }
+        }
+
+class DeploymentInformer:
+    def __init__(self, cluster_name, clients):
+        self.cluster_name = cluster_name
+        self.clients = clients
+        self.envs = set()
+        self.index = {}
+        self.resource_version = None
+        self.synced = False
+        self.forbidden = False
+        self.failures = 0
+        self.last_error = None
+        self.contacted_at = None
+        self.updated_at = None
+        self.result = None
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.watcher = None
+        self.thread = threading.Thread(target=self.run, name=f"informer-{cluster_name}", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.watcher:
+            self.watcher.stop()
+
+    def relist(self):
+        index = {}
+        resource_version = None
+        for deployments, page_resource_version in iter_cluster_deployment_pages(self.clients, self.cluster_name, with_resource_version=True):
+            resource_version = resource_version or page_resource_version
+            for deployment in deployments:
+                index[get_deployment_key(deployment)] = deployment
+
+        with self.lock:
+            self.index = index
+            self.resource_version = resource_version
+            self.updated_at = datetime.now()
+            self.result = None
+            self.synced = True
+        self.record_contact()
+
+    def apply_event(self, event_type, deployment):
+        key = (self.cluster_name, deployment.metadata.namespace, deployment.metadata.name)
+        with self.lock:
+            if event_type == "DELETED":
+                self.index.pop(key, None)
+            else:
+                self.index[key] = build_deployment_info(deployment, self.cluster_name)
+            self.resource_version = deployment.metadata.resource_version
+            self.updated_at = datetime.now()
+            self.result = None
+        self.record_contact()
+
+    def record_contact(self):
+        self.failures = 0
+        self.last_error = None
+        self.contacted_at = time.time()
+
+    def record_failure(self, error):
+        self.failures += 1
+        self.last_error = str(error)
+        if self.failures >= DEPLOYMENT_WATCH_MAX_FAILURES:
+            self.synced = False
+            self.resource_version = None
+
+    def is_synced(self):
+        return self.synced and time.time() - self.contacted_at < DEPLOYMENT_WATCH_STALE_AFTER
+
+    def watch_events(self):
+        self.watcher = watch.Watch()
+        for event in self.watcher.stream(
+            self.clients["apps_v1"].list_deployment_for_all_namespaces,
+            resource_version=self.resource_version,
+            timeout_seconds=DEPLOYMENT_WATCH_TIMEOUT,
+            allow_watch_bookmarks=True
+        ):
+            if self.stop_event.is_set():
+                break
+            if event["type"] == "BOOKMARK":
+                self.resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+                self.record_contact()
+                continue
+            self.apply_event(event["type"], event["object"])
+        self.record_contact()
+
+    def run(self):
+        backoff = 1
+        while not self.stop_event.is_set():
+            try:
+                if self.resource_version is None:
+                    self.relist()
+                self.watch_events()
+                backoff = 1
+            except ApiException as e:
+                if e.status == 410:
+                    self.resource_version = None
+                    continue
+                if e.status == 403:
+                    self.forbidden = True
+                    self.synced = False
+                    return
+                self.record_failure(e)
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, 60)
+            except Exception as e:
+                self.record_failure(e)
+                self.stop_event.wait(backoff)
+                backoff = min(backoff * 2, 60)
+
+    def get_result(self):
+        with self.lock:
+            if self.result is None:
+                self.result = {
+                    "status": "success",
+                    "data": list(self.index.values()),
+                    "resource_version": self.resource_version,
+                    "time": self.updated_at.strftime("%I:%M %p"),
+                    "date": self.updated_at.strftime("%d-%m-%Y")
+                }
+            return self.result
+
+def get_informer_key(env, cluster_name):
+    return (cluster_name, CLUSTERS[env][cluster_name]["host"])
+
+def start_informers(env):
+    stop_informers(env)
+    with cluster_informers_lock:
+        for cluster_name, clients in k8s_clients[env].items():
+            key = get_informer_key(env, cluster_name)
+            informer = cluster_informers.get(key)
+            if informer is None:
+                informer = cluster_informers[key] = DeploymentInformer(cluster_name, clients)
+                informer.start()
+            informer.envs.add(env)
+            deployment_informers[env][cluster_name] = informer
+
+def stop_informers(env):
+    with cluster_informers_lock:
+        for cluster_name, informer in deployment_informers[env].items():
+            informer.envs.discard(env)
+            if not informer.envs:
+                informer.stop()
+                cluster_informers.pop(get_informer_key(env, cluster_name), None)
+        deployment_informers[env].clear()
+
+def get_main_container_field(deployment, field):
+    containers = deployment["main-containers"]
+    return containers[0][field] if containers else ""
+
+SORT_FIELDS = {
+    "name": lambda deployment: deployment["deployment-name"],
+    "version": lambda deployment: get_main_container_field(deployment, "version"),
+    "image": lambda deployment: get_main_container_field(deployment, "image"),
+}
+
+def get_cached_response_body(response_cache, lock, response_key, build_response, encoding):
+    with lock:
+        variants = response_cache.get(response_key)
+        if variants is not None:
+            response_cache.move_to_end(response_key)
+
+    if variants is None:
+        started = time.perf_counter()
+        variants = {"identity": dumps_json(build_response())}
+        metrics.observe("response_serialization_seconds", ("identity",), time.perf_counter() - started)
+    if len(variants["identity"]) < COMPRESSION_MIN_BYTES:
+        encoding = "identity"
+    if encoding not in variants:
+        started = time.perf_counter()
+        variants[encoding] = compress_body(variants["identity"], encoding)
+        metrics.observe("response_serialization_seconds", (encoding,), time.perf_counter() - started)
+
+    with lock:
+        response_cache[response_key] = variants
+        if len(response_cache) > QUERY_CACHE_SIZE:
+            response_cache.popitem(last=False)
+    return variants[encoding], encoding
+
+class DeploymentIndex:
+    def __init__(self, sources, clusters=()):
+        self.sources = sources
+        self.clusters = set(clusters)
+        self.deployments = [deployment for source in sources for deployment in source]
+        self.by_cluster = defaultdict(list)
+        self.by_namespace = defaultdict(list)
+        self.by_image = defaultdict(lambda: defaultdict(list))
+        self.cluster_namespaces = defaultdict(set)
+        self.container_versions = defaultdict(dict)
+        self.search_text = []
+
+        for position, deployment in enumerate(self.deployments):
+            self.by_cluster[deployment["cluster"]].append(position)
+            self.by_namespace[deployment["namespace"]].append(position)
+            self.cluster_namespaces[deployment["cluster"]].add(deployment["namespace"])
+            containers = deployment["main-containers"] + deployment["init-containers"]
+            for repository, version in {(container.reference.name, container.version) for container in containers}:
+                self.by_image[repository][version].append(position)
+            images = [container["image"] for container in containers]
+            self.search_text.append("\n".join([deployment["deployment-name"], deployment["namespace"], *images]).lower())
+            for container, version in get_container_versions(deployment).items():
+                self.container_versions[(deployment["namespace"], deployment["deployment-name"], container)][deployment["cluster"]] = version
+
+        self.namespaces = sorted(self.by_namespace)
+        self.cluster_namespaces = {cluster: sorted(namespaces) for cluster, namespaces in self.cluster_namespaces.items()}
+
+        self.sort_ranks = {}
+        for field, get_value in SORT_FIELDS.items():
+            order = sorted(range(len(self.deployments)), key=lambda position: get_value(self.deployments[position]).lower())
+            ranks = [0] * len(order)
+            for rank, position in enumerate(order):
+                ranks[position] = rank
+            self.sort_ranks[field] = ranks
+
+        self.query_cache = OrderedDict()
+        self.response_cache = OrderedDict()
+        self.content_hash = None
+        self.lock = threading.Lock()
+
+    def get_content_hash(self):
+        with self.lock:
+            if self.content_hash is None:
+                payload = json.dumps(self.deployments, sort_keys=True, separators=(",", ":"), default=to_stored_json_value)
+                self.content_hash = hashlib.sha256(payload.encode()).hexdigest()
+            return self.content_hash
+
+    def matches_sources(self, sources):
+        return len(self.sources) == len(sources) and all(a is b for a, b in zip(self.sources, sources))
+
+    def query(self, cluster=None, namespace=None, search=None, sort=None, descending=False):
+        query_key = (cluster, namespace, search, sort, descending)
+        with self.lock:
+            if query_key in self.query_cache:
+                self.query_cache.move_to_end(query_key)
+                return self.query_cache[query_key]
+
+        if cluster and namespace:
+            namespace_positions = set(self.by_namespace.get(namespace, []))
+            positions = [position for position in self.by_cluster.get(cluster, []) if position in namespace_positions]
+        elif cluster:
+            positions = self.by_cluster.get(cluster, [])
+        elif namespace:
+            positions = self.by_namespace.get(namespace, [])
+        else:
+            positions = range(len(self.deployments))
+
+        if search:
+            search = search.lower()
+            positions = [position for position in positions if search in self.search_text[position]]
+
+        if sort:
+            positions = sorted(positions, key=self.sort_ranks[sort].__getitem__, reverse=descending)
+
+        positions = list(positions)
+        with self.lock:
+            self.query_cache[query_key] = positions
+            if len(self.query_cache) > QUERY_CACHE_SIZE:
+                self.query_cache.popitem(last=False)
+        return positions
+
+    def page(self, positions, page, page_size):
+        start = (page - 1) * page_size
+        return [self.deployments[position] for position in positions[start:start + page_size]]
+
+    def get_response_body(self, response_key, build_response, encoding):
+        return get_cached_response_body(self.response_cache, self.lock, response_key, build_response, encoding)
+
+    def image_versions(self, repository, version=None):
+        versions = self.by_image.get(repository, {})
+        if version is not None:
+            versions = {version: versions[version]} if version in versions else {}
+        return {
+            image_version: [self.deployments[position] for position in positions]
+            for image_version, positions in versions.items()
+        }
+
+class DriftTable:
+    def __init__(self, envs, indexes):
+        self.envs = envs
+        self.indexes = indexes
+        self.clusters = {env: sorted(index.by_cluster) for env, index in zip(envs, indexes)}
+
+        versions = defaultdict(dict)
+        for env, index in zip(envs, indexes):
+            for key, cluster_versions in index.container_versions.items():
+                versions[key][env] = cluster_versions
+
+        self.rows = []
+        for (namespace, deployment_name, container), env_versions in sorted(versions.items()):
+            missing = [env for env in envs if env not in env_versions]
+            distinct = {version for cluster_versions in env_versions.values() for version in cluster_versions.values()}
+            self.rows.append({
+                "namespace": namespace,
+                "deployment-name": deployment_name,
+                "container": container,
+                "versions": env_versions,
+                "missing": missing,
+                "drift": len(distinct) > 1 or bool(missing)
+            })
+        self.drifted = [row for row in self.rows if row["drift"]]
+
+        self.response_cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get_response_body(self, response_key, build_response, encoding):
+        return get_cached_response_body(self.response_cache, self.lock, response_key, build_response, encoding)
+
+    def matches_indexes(self, indexes):
+        return len(self.indexes) == len(indexes) and all(a is b for a, b in zip(self.indexes, indexes))
+
+def get_drift_table(envs, indexes):
+    with drift_tables_lock:
+        table = drift_tables.get(envs)
+        if table is not None and table.matches_indexes(indexes):
+            drift_tables.move_to_end(envs)
+            return table
+
+    table = DriftTable(envs, indexes)
+    with drift_tables_lock:
+        drift_tables[envs] = table
+        drift_tables.move_to_end(envs)
+        if len(drift_tables) > QUERY_CACHE_SIZE:
+            drift_tables.popitem(last=False)
+    return table
+
+def materialize_drift_tables(env):
+    with drift_tables_lock:
+        env_sets = [envs for envs in drift_tables if env in envs]
+    if not env_sets:
+        env_sets = [tuple(CLUSTERS.keys())]
+
+    for envs in env_sets:
+        with env_indexes_lock:
+            indexes = tuple(env_indexes.get(drift_env) for drift_env in envs)
+        if all(index is not None for index in indexes):
+            get_drift_table(envs, indexes)
+
+def parse_drift_envs(value):
+    envs = []
+    for env in (value or "").split(","):
+        env = env.strip().lower()
+        if env and env not in envs:
+            envs.append(env)
+    return tuple(envs) or tuple(CLUSTERS.keys())
+
+def build_drift_etag(indexes, errors, query_string, *validators):
+    digest = hashlib.sha256()
+    for index in indexes:
+        digest.update(index.get_content_hash().encode())
+    digest.update(json.dumps(errors, sort_keys=True).encode())
+    digest.update(json.dumps(validators).encode())
+    digest.update(query_string)
+    return digest.hexdigest()[:32]
+
+def get_deployment_key(deployment):
+    return (deployment["cluster"], deployment["namespace"], deployment["deployment-name"])
+
+def diff_deployments(previous_by_key, current_by_key):
+    return {
+        "added": [d for key, d in current_by_key.items() if key not in previous_by_key],
+        "removed": [d for key, d in previous_by_key.items() if key not in current_by_key],
+        "changed": [
+            {"before": previous_by_key[key], "after": d}
+            for key, d in current_by_key.items()
+            if key in previous_by_key and (
+                previous_by_key[key]["main-containers"] != d["main-containers"]
+                or previous_by_key[key]["init-containers"] != d["init-containers"]
+            )
+        ]
+    }
+
+def get_container_versions(deployment):
+    versions = defaultdict(set)
+    for container in deployment["main-containers"] + deployment["init-containers"]:
+        versions[container.container].add(container.version)
+    return {container: ",".join(sorted(container_versions)) for container, container_versions in versions.items()}
+
+def record_env_history(env, index):
+    if history_store is None:
+        return
+
+    def record():
+        try:
+            history_store.record(env, sorted(index.clusters), index.deployments)
+        except Exception as e:
+            print(f"Failed to record release history for {env}: {e}")
+
+    history_executor.submit(record)
+
+def parse_history_time(value):
+    if value is None or value == "":
+        return None
+    if value.isdigit():
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(value).timestamp())
+    except ValueError:
+        raise ValueError(f"Invalid time '{value}', expected epoch seconds or an ISO 8601 date")
+
+def parse_history_query(args):
+    try:
+        limit = int(args.get("limit", DEFAULT_HISTORY_LIMIT))
+        before = int(args["before"]) if args.get("before") else None
+    except ValueError:
+        raise ValueError("'limit' and 'before' must be integers")
+    if not 1 <= limit <= MAX_HISTORY_LIMIT:
+        raise ValueError(f"'limit' must be between 1 and {MAX_HISTORY_LIMIT}")
+
+    return {
+        "filters": {
+            "cluster": args.get("cluster"),
+            "namespace": args.get("namespace"),
+            "deployment": args.get("deployment"),
+            "container": args.get("container"),
+            "new": args.get("version")
+        },
+        "since": parse_history_time(args.get("since")),
+        "until": parse_history_time(args.get("until")),
+        "before": before,
+        "limit": limit
+    }
+
+def record_env_changes(env, index):
+    baselines = env_baselines[env]
+    seeding = not baselines
+    changes = {"added": [], "removed": [], "changed": []}
+    for cluster_name in index.clusters:
+        current = {
+            get_deployment_key(index.deployments[position]): index.deployments[position]
+            for position in index.by_cluster.get(cluster_name, [])
+        }
+        previous = baselines.get(cluster_name, {})
+        baselines[cluster_name] = current
+        for kind, deployments in diff_deployments(previous, current).items():
+            changes[kind].extend(deployments)
+
+    if seeding:
+        env_revisions[env] += 1
+        return
+
+    if changes["added"] or changes["removed"] or changes["changed"]:
+        env_revisions[env] += 1
+        env_change_log[env].append({
+            "revision": env_revisions[env],
+            "date_time": f"{get_formatted_date()} {get_formatted_time()}",
+            **changes
+        })
+
+def get_env_index(env, results):
+    clusters = [cluster_name for cluster_name, result in results.items() if result.get("status") == "success"]
+    sources = [results[cluster_name]["data"] for cluster_name in clusters]
+    with env_indexes_lock:
+        previous = env_indexes.get(env)
+        if previous is None or not previous.matches_sources(sources):
+            index = DeploymentIndex(sources, clusters)
+            record_env_changes(env, index)
+            record_env_history(env, index)
+            env_indexes[env] = index
+        return env_indexes[env]
+
+def get_revision_epoch():
+    global revision_epoch
+    if revision_epoch is None or revision_epoch[0] != os.getpid():
+        revision_epoch = (os.getpid(), os.urandom(6).hex())
+    return revision_epoch[1]
+
+def get_env_changes(env, since, epoch=None):
+    current_epoch = get_revision_epoch()
+    with env_indexes_lock:
+        revision = env_revisions[env]
+        change_log = list(env_change_log[env])
+
+    reset = (epoch is not None and epoch != current_epoch) or since > revision
+    oldest_revision = change_log[0]["revision"] if change_log else revision + 1
+    return {
+        "epoch": current_epoch,
+        "revision": revision,
+        "since": since,
+        "resync": reset or (since < oldest_revision - 1 and since < revision),
+        "changes": [] if reset else [entry for entry in change_log if entry["revision"] > since]
+    }
+
+def parse_deployment_query(args):
+    sort = args.get("sort") or None
+    descending = bool(sort) and sort.startswith("-")
+    if sort:
+        sort = sort.lstrip("-")
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"Unsupported sort field '{sort}', expected one of: {', '.join(SORT_FIELDS)}")
+
+    try:
+        page = int(args.get("page", 1))
+        page_size = int(args.get("page_size", DEFAULT_PAGE_SIZE))
+    except ValueError:
+        raise ValueError("'page' and 'page_size' must be integers")
+    if page < 1 or not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"'page' must be >= 1 and 'page_size' between 1 and {MAX_PAGE_SIZE}")
+
+    return {
+        "cluster": args.get("cluster") or None,
+        "namespace": args.get("namespace") or None,
+        "search": args.get("search") or None,
+        "sort": sort,
+        "descending": descending,
+        "page": page,
+        "page_size": page_size
+    }
+
+def dumps_json(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, default=to_json_value)
+    return json.dumps(payload, separators=(",", ":"), default=to_json_value).encode()
+
+def dumps_stored_json(payload):
+    if orjson is not None:
+        return orjson.dumps(payload, default=to_stored_json_value)
+    return json.dumps(payload, separators=(",", ":"), default=to_stored_json_value).encode()
+
+def compress_body(body, encoding):
+    if encoding == "br":
+        return brotli.compress(body)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    return body
+
+def choose_encoding(accept_encodings):
+    if brotli is not None and accept_encodings["br"]:
+        return "br"
+    if accept_encodings["gzip"]:
+        return "gzip"
+    return "identity"
+
+def build_etag(index, errors, query_string, *validators):
+    digest = hashlib.sha256(index.get_content_hash().encode())
+    digest.update(json.dumps(errors, sort_keys=True).encode())
+    digest.update(json.dumps(validators).encode())
+    digest.update(query_string)
+    return digest.hexdigest()[:32]
+
+def is_paged_query(args):
+    return any(param in args for param in ("cluster", "namespace", "search", "sort", "page", "page_size"))
+
+def load_env_snapshot(env):
+    if snapshot_store is None:
+        return
+    with snapshot_lock:
+        if env in snapshot_loaded:
+            return
+        snapshot_loaded.add(env)
+
+    try:
+        snapshots = snapshot_store.load(env)
+    except Exception as e:
+        print(f"Failed to load snapshot for {env}: {e}")
+        return
+
+    for cluster_name, (timestamp, result) in snapshots.items():
+        if cluster_name not in CLUSTERS[env] or cluster_name in cluster_cache.latest_keys[env]:
+            continue
+        snapshot_sources[(env, cluster_name)] = result["data"]
+        EnvironmentCache.store(cluster_cache, env, cluster_name, (cluster_name, timestamp), result)
+
+def save_cluster_snapshot(env, cluster_name, timestamp, result):
+    if snapshot_store is None or result.get("status") != "success" or result.get("stale"):
+        return
+    with snapshot_lock:
+        if snapshot_sources.get((env, cluster_name)) is result["data"]:
+            return
+        snapshot_sources[(env, cluster_name)] = result["data"]
+
+    def save():
+        try:
+            snapshot_store.save(env, cluster_name, timestamp, result)
+        except Exception as e:
+            print(f"Failed to save snapshot for {env}/{cluster_name}: {e}")
+
+    snapshot_executor.submit(save)
+
+def delete_env_snapshot(env=None):
+    if snapshot_store is None:
+        return
+    with snapshot_lock:
+        for key in [key for key in snapshot_sources if env is None or key[0] == env]:
+            del snapshot_sources[key]
+    snapshot_store.delete(env)
+
+def lookup_cluster_result(cluster_name, env, timestamp):
+    informer = deployment_informers[env].get(cluster_name)
+    if informer and informer.is_synced():
+        return informer.get_result()
+    return cluster_cache.lookup(get_cluster_info_cached.__wrapped__, cluster_name, env, timestamp)
+
+def submit_cluster_fetch(env, fn, *args):
+    slots = cluster_fetch_slots[env]
+    if not slots.acquire(blocking=False):
+        return None
+
+    def run():
+        try:
+            return fn(*args)
+        finally:
+            slots.release()
+
+    return cluster_executor.submit(run)
+
+def wait_for_cluster_result(cluster_name, env, timestamp, deadline):
+    future = None
+    while True:
+        result = lookup_cluster_result(cluster_name, env, timestamp)
+        if result is not None or time.time() >= deadline:
+            return result
+        if future is None or future.done():
+            future = submit_cluster_fetch(env, cluster_cache.try_refresh, get_cluster_info_cached.__wrapped__, cluster_name, env, timestamp)
+        time.sleep(min(CLUSTER_WAIT_INTERVAL, max(deadline - time.time(), 0)))
+
+def fetch_env_clusters(env, timestamp):
+    load_env_snapshot(env)
+    deadline = time.time() + CLUSTER_FETCH_TIMEOUT
+    results = {}
+    futures = {}
+    for cluster_name in CLUSTERS[env].keys():
+        result = lookup_cluster_result(cluster_name, env, timestamp)
+        if result is not None:
+            results[cluster_name] = result
+        else:
+            futures[cluster_name] = submit_cluster_fetch(env, cluster_cache.try_refresh, get_cluster_info_cached.__wrapped__, cluster_name, env, timestamp)
+    wait([future for future in futures.values() if future is not None], timeout=max(deadline - time.time(), 0))
+
+    for cluster_name, future in futures.items():
+        if future is not None and future.done() and future.exception() is not None:
+            results[cluster_name] = {
+                "status": "error",
+                "error": {
+                    "type": "GeneralException",
+                    "message": str(future.exception())
+                }
+            }
+            continue
+
+        result = future.result() if future is not None and future.done() else None
+        if result is None:
+            result = wait_for_cluster_result(cluster_name, env, timestamp, deadline)
+        if result is None:
+            result = {
+                "status": "error",
+                "error": {
+                    "type": "ClusterTimeout",
+                    "message": f"Cluster '{cluster_name}' did not respond within {CLUSTER_FETCH_TIMEOUT:g}s"
+                }
+            }
+        results[cluster_name] = result
+    return {cluster_name: results[cluster_name] for cluster_name in CLUSTERS[env].keys()}
+
+def collect_env_deployments(env, timestamp):
+    errors = []
+    stale = False
+    response_time = None
+    response_date = None
+
+    results = fetch_env_clusters(env, timestamp)
+    for cluster_name, result in results.items():
+        save_cluster_snapshot(env, cluster_name, timestamp, result)
+        stale = stale or result.get("stale", False)
+        if result.get("status") == "success":
+            if not response_time:
+                response_time = result.get("time")
+                response_date = result.get("date")
+        else:
+            errors.append({"cluster": cluster_name, **result.get("error", {})})
+
+    return get_env_index(env, results), response_time, response_date, errors, stale
+
+def stream_cluster_deployments(cluster_name, env, timestamp, page_queue):
+    streamed = False
+
+    def fetch(cluster_name, env, timestamp):
+        nonlocal streamed
+        streamed = True
+        return get_cluster_info(cluster_name, env, CACHE_DURATIONS[env], timestamp, on_page=lambda infos: page_queue.put((cluster_name, infos, None)))
+
+    try:
+        result = cluster_cache.try_refresh(fetch, cluster_name, env, timestamp)
+        if result is not None and not streamed and result.get("status") == "success":
+            page_queue.put((cluster_name, result["data"], None))
+    except Exception as e:
+        result = {
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            }
+        }
+    page_queue.put((cluster_name, None, result))
+
+def generate_deployment_stream(env, timestamp):
+    load_env_snapshot(env)
+    deadline = time.time() + CLUSTER_FETCH_TIMEOUT
+    page_queue = queue.Queue()
+    pending = list(CLUSTERS[env].keys())
+    for cluster_name in pending:
+        result = lookup_cluster_result(cluster_name, env, timestamp)
+        if result is None:
+            if submit_cluster_fetch(env, stream_cluster_deployments, cluster_name, env, timestamp, page_queue) is not None:
+                continue
+        elif result.get("status") == "success":
+            page_queue.put((cluster_name, result["data"], None))
+        page_queue.put((cluster_name, None, result))
+
+    errors = []
+    stale = False
+    total = 0
+    response_time = None
+    response_date = None
+
+    while pending:
+        try:
+            cluster_name, infos, result = page_queue.get(timeout=max(deadline - time.time(), 0))
+        except queue.Empty:
+            break
+
+        if infos is not None:
+            total += len(infos)
+            yield b"".join(dumps_json(info) + b"\n" for info in infos)
+            continue
+
+        if result is None:
+            result = wait_for_cluster_result(cluster_name, env, timestamp, deadline)
+            if result is None:
+                continue
+            if result.get("status") == "success":
+                total += len(result["data"])
+                yield b"".join(dumps_json(info) + b"\n" for info in result["data"])
+
+        pending.remove(cluster_name)
+        save_cluster_snapshot(env, cluster_name, timestamp, result)
+        stale = stale or result.get("stale", False)
+        if result.get("status") == "success":
+            if not response_time:
+                response_time = result.get("time")
+                response_date = result.get("date")
+        else:
+            errors.append({"cluster": cluster_name, **result.get("error", {})})
+
+    for cluster_name in pending:
+        errors.append({
+            "cluster": cluster_name,
+            "type": "ClusterTimeout",
+            "message": f"Cluster '{cluster_name}' did not respond within {CLUSTER_FETCH_TIMEOUT:g}s"
+        })
+
+    yield dumps_json({
+        "status": "success",
+        "total": total,
+        "errors": errors,
+        "stale": stale,
+        "date_time": f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
+    }) + b"\n"
+
+def collect_cache_metrics():
+    for env in CLUSTERS.keys():
+        stats = cluster_cache.env_cache_stats(env)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        metrics.set("cache_hits_total", (env,), stats["hits"])
+        metrics.set("cache_stale_hits_total", (env,), stats["stale_hits"])
+        metrics.set("cache_misses_total", (env,), stats["misses"])
+        metrics.set("cache_hit_ratio", (env,), (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0)
+        metrics.set("cache_entries", (env,), stats["currsize"])
+        metrics.set("cache_bytes", (env,), stats["bytes"])
+
+def warm_env_cache(env):
+    if not k8s_clients[env]:
+        initialize_k8s_clients(env)
+    return collect_env_deployments(env, get_cache_timestamp(env))
+
+class CacheWarmer:
+    def __init__(self, env):
+        self.env = env
+        self.last_warmed = None
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, name=f"cache-warm-{env}", daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def warm(self, timestamp):
+        if not k8s_clients[self.env]:
+            initialize_k8s_clients(self.env)
+
+        futures = []
+        for cluster_name in CLUSTERS[self.env].keys():
+            informer = deployment_informers[self.env].get(cluster_name)
+            if informer and informer.is_synced():
+                continue
+            future = submit_cluster_fetch(self.env, cluster_cache.try_refresh, get_cluster_info_cached.__wrapped__, cluster_name, self.env, timestamp)
+            if future is not None:
+                futures.append(future)
+        wait(futures, timeout=CLUSTER_FETCH_TIMEOUT)
+        collect_env_deployments(self.env, timestamp)
+        materialize_drift_tables(self.env)
+        self.last_warmed = timestamp
+
+    def run(self):
+        try:
+            warm_env_cache(self.env)
+            materialize_drift_tables(self.env)
+        except Exception as e:
+            print(f"Initial cache warm-up for {self.env} failed: {e}")
+
+        while not self.stop_event.is_set():
+            duration = CACHE_DURATIONS[self.env]
+            current_timestamp = get_cache_timestamp(self.env)
+            next_timestamp = cluster_cache.get_cache_timestamp(self.env, current_timestamp + duration * 1.5)
+            if self.last_warmed is not None and next_timestamp <= self.last_warmed:
+                next_timestamp = cluster_cache.get_cache_timestamp(self.env, current_timestamp + duration * 2.5)
+
+            warm_at = next_timestamp - CACHE_WARM_LEAD - random.uniform(0, CACHE_WARM_JITTER)
+            if self.stop_event.wait(max(warm_at - time.time(), 0)):
+                return
+            try:
+                self.warm(next_timestamp)
+            except Exception as e:
+                print(f"Cache warm-up for {self.env} failed: {e}")
+                self.stop_event.wait(CACHE_WARM_LEAD)
+
+def start_cache_warmers():
+    if not CACHE_WARM_ENABLED:
+        return
+    stop_cache_warmers()
+    for env in CLUSTERS.keys():
+        warmer = CacheWarmer(env)
+        cache_warmers[env] = warmer
+        warmer.start()
+
+def stop_cache_warmers():
+    for warmer in cache_warmers.values():
+        warmer.stop()
+    cache_warmers.clear()
+
+def shutdown_backend():
+    stop_cache_warmers()
+    for env in deployment_informers:
+        stop_informers(env)
+    snapshot_executor.shutdown(wait=True)
+    history_executor.shutdown(wait=True)
+    cluster_executor.shutdown(wait=False, cancel_futures=True)
+
+@app.route('/api/<env>', methods=['GET'])
+def get_deployments_by_env(env):
+    try:
+        env = env.lower()
+        if env not in CLUSTERS:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidEnvironment",
+                    "message": f"Environment '{env}' not supported"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
 
-k8s_clients = {env: {} for env in CLUSTERS.keys()}
+        stream = request.args.get("stream")
+        try:
+            if stream and stream != "ndjson":
+                raise ValueError(f"Unsupported stream format '{stream}', expected: ndjson")
+            query = parse_deployment_query(request.args) if is_paged_query(request.args) and not stream else None
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidQuery",
+                    "message": str(e)
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 400
 
-CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+        if not k8s_clients[env]:
+            initialize_k8s_clients(env)
 
-class EnvironmentCache:
-    def __init__(self, maxsize=256):
-        self.maxsize = maxsize
-        self.cache = defaultdict(dict)
-        self.cache_info_data = defaultdict(lambda: {"hits": 0, "misses": 0})
-        self.last_access_time = defaultdict(float)
+        timestamp = get_cache_timestamp(env)
+        if stream:
+            response = app.response_class(generate_deployment_stream(env, timestamp), mimetype="application/x-ndjson")
+            response.headers["Cache-Control"] = "no-cache"
+            response.headers["X-Accel-Buffering"] = "no"
+            return response
 
-    def get_cache_timestamp(self, env, current_time=None):
-        if current_time is None:
-            current_time = time.time()
-        
-        if not self.last_access_time[env]:
-            self.last_access_time[env] = current_time
-            return current_time
-        
-        time_elapsed = current_time - self.last_access_time[env]
-        duration = CACHE_DURATIONS[env]
-        intervals = int(time_elapsed / duration)
+        index, response_time, response_date, errors, stale = collect_env_deployments(env, timestamp)
         
-        return self.last_access_time[env] + (intervals * duration)
+        date_time = f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
+        revision = env_revisions[env]
+        epoch = get_revision_epoch()
 
-    def cache_info(self):
-        total_hits = sum(info["hits"] for info in self.cache_info_data.values())
-        total_misses = sum(info["misses"] for info in self.cache_info_data.values())
-        total_size = sum(len(cache) for cache in self.cache.values())
-        return CacheInfo(total_hits, total_misses, self.maxsize, total_size)
-
-    def env_cache_info(self, env):
-        info = self.cache_info_data[env]
-        size = len(self.cache.get(env, {}))
-        return CacheInfo(info["hits"], info["misses"], self.maxsize, size)
+        etag = build_etag(index, errors, request.query_string, stale, date_time, epoch, revision)
+        if not stale and request.if_none_match.contains_weak(etag):
+            not_modified = app.response_class(status=304)
+            not_modified.set_etag(etag, weak=True)
+            return not_modified
 
-    def cache_clear(self, env=None):
-        if env is None:
-            self.cache.clear()
-            self.cache_info_data.clear()
-            self.last_access_time.clear()
-        else:
-            if env in self.cache:
-                del self.cache[env]
-                del self.cache_info_data[env]
-                del self.last_access_time[env]
+        def build_response():
+            response = {
+                "status": "success",
+                "data": index.deployments,
+                "epoch": epoch,
+                "revision": revision,
+                "errors": errors,
+                "stale": stale,
+                "date_time": date_time
+            }
+            if query:
+                positions = index.query(query["cluster"], query["namespace"], query["search"], query["sort"], query["descending"])
+                response.update({
+                    "data": index.page(positions, query["page"], query["page_size"]),
+                    "total": len(positions),
+                    "page": query["page"],
+                    "page_size": query["page_size"]
+                })
+            return response
 
-    def __call__(self, func):
-        @wraps(func)
-        def wrapper(cluster_name, env, timestamp):
-            cache_key = (cluster_name, timestamp)
-            current_time = time.time()
-            cache_timestamp = self.get_cache_timestamp(env, current_time)
-            
-            if current_time > (cache_timestamp + CACHE_DURATIONS[env]):
-                self.cache[env].clear()  
-                self.last_access_time[env] = current_time  
-                cache_timestamp = current_time
-                cache_key = (cluster_name, cache_timestamp)
-            
-            if cache_key in self.cache[env]:
-                self.cache_info_data[env]["hits"] += 1
-                return self.cache[env][cache_key]
-            
-            self.cache_info_data[env]["misses"] += 1
-            result = func(cluster_name, env, cache_timestamp)
-            
-            self.cache[env][cache_key] = result
-            
-            if len(self.cache[env]) > self.maxsize:
-                oldest_key = min(self.cache[env].keys(), key=lambda k: k[1])
-                self.cache[env].pop(oldest_key)
+        body, encoding = index.get_response_body((etag, date_time, stale, epoch, revision), build_response, choose_encoding(request.accept_encodings))
+        response = app.response_class(body, mimetype="application/json")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        if not stale:
+            response.set_etag(etag, weak=True)
+        return response
             
-            return result
-        return wrapper
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
 
-cluster_cache = EnvironmentCache(maxsize=256)
+@app.route('/api/<env>/changes', methods=['GET'])
+def get_changes_by_env(env):
+    try:
+        env = env.lower()
+        if env not in CLUSTERS:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidEnvironment",
+                    "message": f"Environment '{env}' not supported"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
 
-def get_formatted_time():
-    return datetime.now().strftime("%I:%M %p")
+        since = request.args.get("since", "0")
+        if not since.isdigit():
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidQuery",
+                    "message": "'since' must be a non-negative integer revision"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 400
 
-def get_formatted_date():
-    return datetime.now().strftime("%d-%m-%Y")
+        if not k8s_clients[env]:
+            initialize_k8s_clients(env)
 
-def initialize_k8s_clients(env):
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    for cluster_name, cluster_info in CLUSTERS[env].items():
-        configuration = client.Configuration()
-        configuration.host = cluster_info["host"]
-        configuration.verify_ssl = False
-        configuration.api_key = {"authorization": f"Bearer {cluster_info['token']}"}
-        
-        api_client = client.ApiClient(configuration)
-        k8s_clients[env][cluster_name] = {
-            "apps_v1": client.AppsV1Api(api_client),
-            "core_v1": client.CoreV1Api(api_client)
-        }
+        index, response_time, response_date, errors, stale = collect_env_deployments(env, get_cache_timestamp(env))
 
-def extract_version_from_image(image_string):
-    match = VERSION_PATTERN.search(image_string)
-    if not match:
-        return "None"
-    return match.group(1)
+        return jsonify({
+            "status": "success",
+            "data": get_env_changes(env, int(since), request.args.get("epoch") or None),
+            "errors": errors,
+            "stale": stale,
+            "date_time": f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
+        })
 
-def process_container_images(containers):
-    if not containers:
-        return []
-    return [{
-        "image": container.image,
-        "version": extract_version_from_image(container.image)
-    } for container in containers]
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
 
-def get_cache_timestamp(env):
-    return cluster_cache.get_cache_timestamp(env)
+@app.route('/api/<env>/history', methods=['GET'])
+def get_history_by_env(env):
+    try:
+        env = env.lower()
+        if env not in CLUSTERS:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidEnvironment",
+                    "message": f"Environment '{env}' not supported"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
 
-@cluster_cache
-def get_cluster_info_cached(cluster_name, env, timestamp):
-    return get_cluster_info(cluster_name, env, CACHE_DURATIONS[env], timestamp)
+        if history_store is None:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "HistoryDisabled",
+                    "message": "Release history is disabled (HISTORY_ENABLED=false)"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
+
+        try:
+            query = parse_history_query(request.args)
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidQuery",
+                    "message": str(e)
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 400
+
+        data = history_store.query(env, query["filters"], query["since"], query["until"], query["before"], query["limit"])
+        return jsonify({
+            "status": "success",
+            "data": data,
+            "limit": query["limit"],
+            "next_before": data[-1]["id"] if len(data) == query["limit"] else None,
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
 
-def get_cluster_info(cluster_name, env, cache_duration, cache_timestamp):
+@app.route('/api/<env>/namespaces', methods=['GET'])
+def get_namespaces_by_env(env):
     try:
-        if cluster_name not in k8s_clients[env]:
-            return {
+        env = env.lower()
+        if env not in CLUSTERS:
+            return jsonify({
                 "status": "error",
                 "error": {
-                    "type": "ClusterNotFound",
-                    "message": f"Cluster '{cluster_name}' not found in {env} environment"
-                }
-            }
-        
-        clients = k8s_clients[env][cluster_name]
-        cluster_info = []
-        current_time = get_formatted_time()
-        current_date = get_formatted_date()
-        namespaces = clients["core_v1"].list_namespace()
-        
-        for ns in namespaces.items:
-            namespace_name = ns.metadata.name
-            deployments = clients["apps_v1"].list_namespaced_deployment(namespace_name)
-            
-            for deployment in deployments.items:
-                deployment_info = {
-                    "deployment-name": deployment.metadata.name,
-                    "namespace": namespace_name,
-                    "cluster": cluster_name,
-                    "main-containers": process_container_images(deployment.spec.template.spec.containers),
-                    "init-containers": process_container_images(deployment.spec.template.spec.init_containers) if deployment.spec.template.spec.init_containers else [],
-                }
-                cluster_info.append(deployment_info)
-        
-        return {"status": "success", "data": cluster_info, "time": current_time, "date": current_date}
+                    "type": "InvalidEnvironment",
+                    "message": f"Environment '{env}' not supported"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
+
+        if not k8s_clients[env]:
+            initialize_k8s_clients(env)
+
+        index, response_time, response_date, errors, stale = collect_env_deployments(env, get_cache_timestamp(env))
+
+        return jsonify({
+            "status": "success",
+            "data": {
+                "namespaces": index.namespaces,
+                "clusters": index.cluster_namespaces
+            },
+            "errors": errors,
+            "stale": stale,
+            "date_time": f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
+        })
 
     except Exception as e:
-        return {
+        return jsonify({
             "status": "error",
             "error": {
                 "type": "GeneralException",
                 "message": str(e)
-            }
-        }
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
 
-@app.route('/api/<env>', methods=['GET'])
-def get_deployments_by_env(env):
+@app.route('/api/<env>/images/<path:repository>', methods=['GET'])
+def get_image_versions_by_env(env, repository):
     try:
         env = env.lower()
         if env not in CLUSTERS:
@@ -219,25 +2288,95 @@ def get_deployments_by_env(env):
         if not k8s_clients[env]:
             initialize_k8s_clients(env)
 
-        timestamp = get_cache_timestamp(env)
-        all_deployments = []
-        response_time = None
-        response_date = None
-        
-        for cluster_name in CLUSTERS[env].keys():
-            result = get_cluster_info_cached(cluster_name, env, timestamp)
-            if result.get("status") == "success":
-                all_deployments.extend(result["data"])
-                if not response_time:
-                    response_time = result.get("time")
-                    response_date = result.get("date")
-        
+        index, response_time, response_date, errors, stale = collect_env_deployments(env, get_cache_timestamp(env))
+
         return jsonify({
             "status": "success",
-            "data": all_deployments,
+            "data": {
+                "repository": repository,
+                "versions": index.image_versions(repository, request.args.get("version"))
+            },
+            "errors": errors,
+            "stale": stale,
             "date_time": f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
         })
-            
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
+@app.route('/api/drift', methods=['GET'])
+def get_version_drift():
+    try:
+        envs = parse_drift_envs(request.args.get("envs"))
+        for env in envs:
+            if env not in CLUSTERS:
+                return jsonify({
+                    "status": "error",
+                    "error": {
+                        "type": "InvalidEnvironment",
+                        "message": f"Environment '{env}' not supported"
+                    },
+                    "time": get_formatted_time(),
+                    "date": get_formatted_date()
+                }), 404
+
+        indexes = []
+        errors = []
+        stale = False
+        response_time = None
+        response_date = None
+        for env in envs:
+            if not k8s_clients[env]:
+                initialize_k8s_clients(env)
+            index, env_time, env_date, env_errors, env_stale = collect_env_deployments(env, get_cache_timestamp(env))
+            indexes.append(index)
+            errors.extend({"env": env, **error} for error in env_errors)
+            stale = stale or env_stale
+            if not response_time:
+                response_time = env_time
+                response_date = env_date
+
+        table = get_drift_table(envs, tuple(indexes))
+
+        date_time = f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
+
+        etag = build_drift_etag(indexes, errors, request.query_string, stale, date_time)
+        if not stale and request.if_none_match.contains_weak(etag):
+            not_modified = app.response_class(status=304)
+            not_modified.set_etag(etag, weak=True)
+            return not_modified
+        drifted_only = request.args.get("drifted", "false").lower() == "true"
+
+        def build_response():
+            return {
+                "status": "success",
+                "data": table.drifted if drifted_only else table.rows,
+                "envs": list(envs),
+                "clusters": table.clusters,
+                "total": len(table.rows),
+                "drifted": len(table.drifted),
+                "errors": errors,
+                "stale": stale,
+                "date_time": date_time
+            }
+
+        body, encoding = table.get_response_body((etag, date_time, stale), build_response, choose_encoding(request.accept_encodings))
+        response = app.response_class(body, mimetype="application/json")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        if not stale:
+            response.set_etag(etag, weak=True)
+        return response
+
     except Exception as e:
         return jsonify({
             "status": "error",
@@ -266,28 +2405,21 @@ def refresh_env_cache(env):
             }), 404
 
         cluster_cache.cache_clear(env)
+        delete_env_snapshot(env)
         
+        stop_informers(env)
         if k8s_clients[env]:
             k8s_clients[env].clear()
         initialize_k8s_clients(env)
 
         timestamp = get_cache_timestamp(env)
-        all_deployments = []
-        response_time = None
-        response_date = None
-
-        for cluster_name in CLUSTERS[env].keys():
-            result = get_cluster_info_cached(cluster_name, env, timestamp)
-            if result.get("status") == "success":
-                all_deployments.extend(result["data"])
-                if not response_time:
-                    response_time = result.get("time")
-                    response_date = result.get("date")
+        index, response_time, response_date, errors, stale = collect_env_deployments(env, timestamp)
 
         return jsonify({
             "status": "success",
             "message": f"Cache cleared and refreshed for {env} environment",
-            "data": all_deployments,
+            "data": index.deployments,
+            "errors": errors,
             "time": response_time or get_formatted_time(),
             "date": response_date or get_formatted_date()
         })
@@ -329,8 +2461,10 @@ def list_clusters():
 def clear_cache():
     try:
         cluster_cache.cache_clear()
+        delete_env_snapshot()
         
         for env in k8s_clients:
+            stop_informers(env)
             k8s_clients[env].clear()
         
         return jsonify({
@@ -357,17 +2491,32 @@ def get_cache_status():
         
         cache_status = {}
         for env in CLUSTERS.keys():
-            env_cache_info = cluster_cache.env_cache_info(env)
+            env_cache_stats = cluster_cache.env_cache_stats(env)
             last_access = cluster_cache.last_access_time.get(env)
             cache_status[env] = {
-                "hits": env_cache_info.hits,
-                "misses": env_cache_info.misses,
-                "currsize": env_cache_info.currsize,
+                "hits": env_cache_stats["hits"],
+                "misses": env_cache_stats["misses"],
+                "stale_hits": env_cache_stats["stale_hits"],
+                "currsize": env_cache_stats["currsize"],
+                "bytes": env_cache_stats["bytes"],
                 "duration": CACHE_DURATIONS[env],
-                "last_access": datetime.fromtimestamp(last_access).strftime("%I:%M %p") if last_access else None
+                "last_access": datetime.fromtimestamp(last_access).strftime("%I:%M %p") if last_access else None,
+                "watch": {
+                    cluster_name: {
+                        "synced": informer.is_synced(),
+                        "forbidden": informer.forbidden,
+                        "failures": informer.failures,
+                        "last_error": informer.last_error,
+                        "resource_version": informer.resource_version,
+                        "deployments": len(informer.index)
+                    }
+                    for cluster_name, informer in deployment_informers[env].items()
+                },
+                "snapshot": snapshot_store.resource_versions(env) if snapshot_store else {}
             }
 
         total_cache_info = cluster_cache.cache_info()
+        image_cache_info = get_container_image.cache_info()
         
         return jsonify({
             "status": "success",
@@ -377,8 +2526,10 @@ def get_cache_status():
                     "misses": total_cache_info.misses,
                     "maxsize": total_cache_info.maxsize,
                     "currsize": total_cache_info.currsize,
+                    "max_bytes": cluster_cache.max_bytes,
                 },
-                "environments": cache_status
+                "environments": cache_status,
+                "images": image_cache_info._asdict()
             },
             "current_time": datetime.fromtimestamp(current_time).strftime("%I:%M %p"),
             "time": get_formatted_time(),
@@ -395,6 +2546,22 @@ def get_cache_status():
             "date": get_formatted_date()
         }), 500
 
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    try:
+        collect_cache_metrics()
+        return app.response_class(metrics.render(), mimetype="text/plain; version=0.0.4")
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
 @app.route('/api/cache/timestamp', methods=['GET'])
 def get_current_timestamp():
     try:
@@ -427,4 +2594,5 @@ def get_current_timestamp():
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    app.run(host='0.0.0.0', port=port, debug=True)
\ No newline at end of file
+    start_cache_warmers()
+    app.run(host='0.0.0.0', port=port, debug=os.environ.get("FLASK_DEBUG", "false").lower() == "true")
\ No newline at end of file
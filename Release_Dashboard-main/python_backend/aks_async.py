@@ -0,0 +1,502 @@
+from quart import Quart, jsonify, request
+from quart_cors import cors
+from kubernetes_asyncio import client
+from kubernetes_asyncio.client.exceptions import ApiException
+from kubernetes_asyncio.client.rest import RESTResponse
+import asyncio
+import os
+import time
+from datetime import datetime
+
+from aks import (
+    CACHE_DURATIONS,
+    CACHE_MAX_BYTES,
+    CLUSTERS,
+    CLUSTER_FETCH_TIMEOUT,
+    DEPLOYMENT_COLLECTION_MODE,
+    DEPLOYMENT_FETCH_MODE,
+    DEPLOYMENT_PAGE_SIZE,
+    K8S_CONNECTION_POOL_MAXSIZE,
+    NAMESPACE_FETCH_CONCURRENCY,
+    NAMESPACE_FETCH_RETRIES,
+    TABLE_ACCEPT_HEADER,
+    EnvironmentCache,
+    RecordJSONProvider,
+    build_deployment_info,
+    build_etag,
+    build_raw_deployment_info,
+    build_table_deployment_infos,
+    choose_encoding,
+    env_revisions,
+    get_container_image,
+    get_env_index,
+    get_formatted_date,
+    get_formatted_time,
+    get_retry_delay,
+    get_revision_epoch,
+    is_paged_query,
+    loads_json,
+    parse_deployment_query
+)
+
+app = Quart(__name__)
+app.json = RecordJSONProvider(app)
+app = cors(app, allow_origin="*", allow_methods=["GET", "OPTIONS", "POST"], allow_headers=["Content-Type", "If-None-Match"], expose_headers=["ETag"])
+
+k8s_clients = {env: {} for env in CLUSTERS.keys()}
+
+cluster_cache = EnvironmentCache(maxsize=256, max_bytes=CACHE_MAX_BYTES)
+
+refresh_tasks = {}
+
+async def initialize_k8s_clients(env):
+    for cluster_name, cluster_info in CLUSTERS[env].items():
+        configuration = client.Configuration()
+        configuration.host = cluster_info["host"]
+        configuration.verify_ssl = False
+        configuration.api_key = {"authorization": f"Bearer {cluster_info['token']}"}
+        configuration.connection_pool_maxsize = K8S_CONNECTION_POOL_MAXSIZE
+
+        apps_client = client.ApiClient(configuration)
+        if DEPLOYMENT_FETCH_MODE == "table":
+            apps_client.set_default_header("Accept", TABLE_ACCEPT_HEADER)
+        k8s_clients[env][cluster_name] = {
+            "apps_v1": client.AppsV1Api(apps_client),
+            "core_v1": client.CoreV1Api(client.ApiClient(configuration)),
+            "semaphore": asyncio.Semaphore(NAMESPACE_FETCH_CONCURRENCY)
+        }
+
+async def close_k8s_clients(env):
+    clients = list(k8s_clients[env].values())
+    k8s_clients[env].clear()
+    for cluster_clients in clients:
+        await cluster_clients["apps_v1"].api_client.close()
+        await cluster_clients["core_v1"].api_client.close()
+
+async def list_deployment_page(list_call, cluster_name, *args, **kwargs):
+    if DEPLOYMENT_FETCH_MODE == "model":
+        page = await list_call(*args, **kwargs)
+        return [build_deployment_info(deployment, cluster_name) for deployment in page.items], page.metadata._continue
+
+    response = await list_call(*args, _preload_content=False, **kwargs)
+    try:
+        payload = await response.read()
+    finally:
+        response.release()
+    if not 200 <= response.status <= 299:
+        raise ApiException(http_resp=RESTResponse(response, payload))
+
+    body = loads_json(payload)
+    if body.get("kind") == "Table":
+        infos = build_table_deployment_infos(body, cluster_name)
+    else:
+        infos = [build_raw_deployment_info(item, cluster_name) for item in body.get("items") or []]
+    return infos, (body.get("metadata") or {}).get("continue")
+
+async def list_cluster_deployments(clients, cluster_name):
+    deployments = []
+    continue_token = None
+    while True:
+        kwargs = {"limit": DEPLOYMENT_PAGE_SIZE}
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        infos, continue_token = await list_deployment_page(
+            clients["apps_v1"].list_deployment_for_all_namespaces,
+            cluster_name,
+            _request_timeout=CLUSTER_FETCH_TIMEOUT,
+            **kwargs
+        )
+        deployments.extend(infos)
+        if not continue_token:
+            return deployments
+
+async def list_namespace_deployments(clients, cluster_name, namespace_name):
+    for attempt in range(NAMESPACE_FETCH_RETRIES + 1):
+        try:
+            async with clients["semaphore"]:
+                infos, _ = await list_deployment_page(
+                    clients["apps_v1"].list_namespaced_deployment,
+                    cluster_name,
+                    namespace_name,
+                    _request_timeout=CLUSTER_FETCH_TIMEOUT
+                )
+            return infos
+        except ApiException as e:
+            if e.status != 429 or attempt == NAMESPACE_FETCH_RETRIES:
+                raise
+            delay = get_retry_delay(e, attempt)
+        await asyncio.sleep(delay)
+
+async def list_namespaced_deployments(clients, cluster_name):
+    namespaces = await clients["core_v1"].list_namespace(_request_timeout=CLUSTER_FETCH_TIMEOUT)
+    pages = await asyncio.gather(*[
+        list_namespace_deployments(clients, cluster_name, ns.metadata.name)
+        for ns in namespaces.items
+    ])
+    return [info for page in pages for info in page]
+
+async def list_deployments(clients, cluster_name):
+    if DEPLOYMENT_COLLECTION_MODE == "namespaced":
+        return await list_namespaced_deployments(clients, cluster_name)
+
+    try:
+        return await list_cluster_deployments(clients, cluster_name)
+    except ApiException as e:
+        if e.status != 403:
+            raise
+        return await list_namespaced_deployments(clients, cluster_name)
+
+async def get_cluster_info(cluster_name, env):
+    try:
+        if cluster_name not in k8s_clients[env]:
+            return {
+                "status": "error",
+                "error": {
+                    "type": "ClusterNotFound",
+                    "message": f"Cluster '{cluster_name}' not found in {env} environment"
+                }
+            }
+
+        current_time = get_formatted_time()
+        current_date = get_formatted_date()
+        cluster_info = await asyncio.wait_for(list_deployments(k8s_clients[env][cluster_name], cluster_name), CLUSTER_FETCH_TIMEOUT)
+        return {"status": "success", "data": cluster_info, "time": current_time, "date": current_date}
+
+    except asyncio.TimeoutError:
+        return {
+            "status": "error",
+            "error": {
+                "type": "ClusterTimeout",
+                "message": f"Cluster '{cluster_name}' did not respond within {CLUSTER_FETCH_TIMEOUT:g}s"
+            }
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            }
+        }
+
+def refresh_cluster(cluster_name, env, timestamp):
+    cache_key = (cluster_name, timestamp)
+    task = refresh_tasks.get((env, cache_key))
+    if task is None:
+        async def run():
+            try:
+                with cluster_cache.get_env_lock(env):
+                    cluster_cache.cache_info_data[env]["misses"] += 1
+                result = await get_cluster_info(cluster_name, env)
+                await asyncio.to_thread(cluster_cache.store, env, cluster_name, cache_key, result)
+                return result
+            finally:
+                refresh_tasks.pop((env, cache_key), None)
+
+        task = refresh_tasks[(env, cache_key)] = asyncio.ensure_future(run())
+    return task
+
+async def get_cluster_info_cached(cluster_name, env, timestamp):
+    result = cluster_cache.get(env, (cluster_name, timestamp))
+    if result is not None:
+        return result
+
+    stale_result = cluster_cache.get_stale(env, cluster_name)
+    if stale_result is not None:
+        refresh_cluster(cluster_name, env, timestamp)
+        return {**stale_result, "stale": True}
+
+    return await asyncio.shield(refresh_cluster(cluster_name, env, timestamp))
+
+async def collect_env_deployments(env, timestamp):
+    errors = []
+    stale = False
+    response_time = None
+    response_date = None
+
+    cluster_names = list(CLUSTERS[env].keys())
+    results = dict(zip(cluster_names, await asyncio.gather(*[
+        get_cluster_info_cached(cluster_name, env, timestamp) for cluster_name in cluster_names
+    ])))
+    for cluster_name, result in results.items():
+        stale = stale or result.get("stale", False)
+        if result.get("status") == "success":
+            if not response_time:
+                response_time = result.get("time")
+                response_date = result.get("date")
+        else:
+            errors.append({"cluster": cluster_name, **result.get("error", {})})
+
+    index = await asyncio.to_thread(get_env_index, env, results)
+    return index, response_time, response_date, errors, stale
+
+@app.after_serving
+async def shutdown():
+    for env in k8s_clients:
+        await close_k8s_clients(env)
+
+@app.route('/api/<env>', methods=['GET'])
+async def get_deployments_by_env(env):
+    try:
+        env = env.lower()
+        if env not in CLUSTERS:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidEnvironment",
+                    "message": f"Environment '{env}' not supported"
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
+
+        try:
+            query = parse_deployment_query(request.args) if is_paged_query(request.args) else None
+        except ValueError as e:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidQuery",
+                    "message": str(e)
+                },
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 400
+
+        if not k8s_clients[env]:
+            await initialize_k8s_clients(env)
+
+        timestamp = cluster_cache.get_cache_timestamp(env)
+        index, response_time, response_date, errors, stale = await collect_env_deployments(env, timestamp)
+
+        date_time = f"{response_date or get_formatted_date()} {response_time or get_formatted_time()}"
+        revision = env_revisions[env]
+        epoch = get_revision_epoch()
+
+        etag = build_etag(index, errors, request.query_string, stale, date_time, epoch, revision)
+        if not stale and request.if_none_match.contains_weak(etag):
+            not_modified = app.response_class("", status=304)
+            not_modified.set_etag(etag, weak=True)
+            return not_modified
+
+        def build_response():
+            response = {
+                "status": "success",
+                "data": index.deployments,
+                "epoch": epoch,
+                "revision": revision,
+                "errors": errors,
+                "stale": stale,
+                "date_time": date_time
+            }
+            if query:
+                positions = index.query(query["cluster"], query["namespace"], query["search"], query["sort"], query["descending"])
+                response.update({
+                    "data": index.page(positions, query["page"], query["page_size"]),
+                    "total": len(positions),
+                    "page": query["page"],
+                    "page_size": query["page_size"]
+                })
+            return response
+
+        body, encoding = await asyncio.to_thread(
+            index.get_response_body,
+            (etag, date_time, stale, epoch, revision),
+            build_response,
+            choose_encoding(request.accept_encodings)
+        )
+        response = app.response_class(body, mimetype="application/json")
+        if encoding != "identity":
+            response.headers["Content-Encoding"] = encoding
+        response.headers["Vary"] = "Accept-Encoding"
+        if not stale:
+            response.set_etag(etag, weak=True)
+        return response
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
+@app.route('/api/cache/refresh/<env>', methods=['POST'])
+async def refresh_env_cache(env):
+    try:
+        env = env.lower()
+        if env not in CLUSTERS:
+            return jsonify({
+                "status": "error",
+                "error": {
+                    "type": "InvalidEnvironment",
+                    "message": f"Environment '{env}' not supported"
+                },
+                "data": [],
+                "time": get_formatted_time(),
+                "date": get_formatted_date()
+            }), 404
+
+        cluster_cache.cache_clear(env)
+
+        await close_k8s_clients(env)
+        await initialize_k8s_clients(env)
+
+        timestamp = cluster_cache.get_cache_timestamp(env)
+        index, response_time, response_date, errors, stale = await collect_env_deployments(env, timestamp)
+
+        return jsonify({
+            "status": "success",
+            "message": f"Cache cleared and refreshed for {env} environment",
+            "data": index.deployments,
+            "errors": errors,
+            "time": response_time or get_formatted_time(),
+            "date": response_date or get_formatted_date()
+        })
+
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "data": [],
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
+@app.route('/api/health', methods=['GET'])
+async def health_check():
+    return jsonify({
+        "status": "healthy",
+        "time": get_formatted_time(),
+        "date": get_formatted_date()
+    })
+
+@app.route('/api/clusters', methods=['GET'])
+async def list_clusters():
+    all_clusters = {
+        env: list(clients.keys())
+        for env, clients in k8s_clients.items()
+    }
+    return jsonify({
+        "status": "success",
+        "data": all_clusters,
+        "time": get_formatted_time(),
+        "date": get_formatted_date()
+    })
+
+@app.route('/api/cache/clear', methods=['POST'])
+async def clear_cache():
+    try:
+        cluster_cache.cache_clear()
+
+        for env in k8s_clients:
+            await close_k8s_clients(env)
+
+        return jsonify({
+            "status": "success",
+            "message": "Cache cleared successfully",
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        })
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
+@app.route('/api/cache/status', methods=['GET'])
+async def get_cache_status():
+    try:
+        current_time = time.time()
+
+        cache_status = {}
+        for env in CLUSTERS.keys():
+            env_cache_stats = cluster_cache.env_cache_stats(env)
+            last_access = cluster_cache.last_access_time.get(env)
+            cache_status[env] = {
+                "hits": env_cache_stats["hits"],
+                "misses": env_cache_stats["misses"],
+                "stale_hits": env_cache_stats["stale_hits"],
+                "currsize": env_cache_stats["currsize"],
+                "bytes": env_cache_stats["bytes"],
+                "duration": CACHE_DURATIONS[env],
+                "last_access": datetime.fromtimestamp(last_access).strftime("%I:%M %p") if last_access else None,
+                "watch": {}
+            }
+
+        total_cache_info = cluster_cache.cache_info()
+        image_cache_info = get_container_image.cache_info()
+
+        return jsonify({
+            "status": "success",
+            "cache_info": {
+                "total": {
+                    "hits": total_cache_info.hits,
+                    "misses": total_cache_info.misses,
+                    "maxsize": total_cache_info.maxsize,
+                    "currsize": total_cache_info.currsize,
+                    "max_bytes": cluster_cache.max_bytes,
+                },
+                "environments": cache_status,
+                "images": image_cache_info._asdict()
+            },
+            "current_time": datetime.fromtimestamp(current_time).strftime("%I:%M %p"),
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        })
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
+@app.route('/api/cache/timestamp', methods=['GET'])
+async def get_current_timestamp():
+    try:
+        current_time = time.time()
+        cache_timestamps = {}
+
+        for env in CLUSTERS.keys():
+            last_access = cluster_cache.last_access_time.get(env)
+            cache_timestamps[env] = {
+                "timestamp": cluster_cache.get_cache_timestamp(env),
+                "duration": CACHE_DURATIONS[env],
+                "last_access": last_access
+            }
+
+        return jsonify({
+            "status": "success",
+            "time": get_formatted_time(),
+            "current_timestamp": current_time,
+            "cache_timestamps": cache_timestamps
+        })
+    except Exception as e:
+        return jsonify({
+            "status": "error",
+            "error": {
+                "type": "GeneralException",
+                "message": str(e)
+            },
+            "time": get_formatted_time(),
+            "date": get_formatted_date()
+        }), 500
+
+if __name__ == "__main__":
+    port = int(os.environ.get("PORT", 5000))
+    app.run(host='0.0.0.0', port=port)
@@ -0,0 +1,168 @@
+import argparse
+import json
+import time
+import tracemalloc
+from io import BytesIO
+
+import urllib3
+from kubernetes import client
+
+import aks
+
+def build_container(name, image, index):
+    return {
+        "name": name,
+        "image": image,
+        "imagePullPolicy": "IfNotPresent",
+        "ports": [{"containerPort": 8080, "protocol": "TCP", "name": "http"}],
+        "env": [{"name": f"SETTING_{i}", "value": f"value-{index}-{i}"} for i in range(12)],
+        "resources": {
+            "limits": {"cpu": "500m", "memory": "512Mi"},
+            "requests": {"cpu": "100m", "memory": "128Mi"}
+        },
+        "livenessProbe": {
+            "httpGet": {"path": "/healthz", "port": 8080, "scheme": "HTTP"},
+            "initialDelaySeconds": 10,
+            "periodSeconds": 10,
+            "timeoutSeconds": 1,
+            "successThreshold": 1,
+            "failureThreshold": 3
+        },
+        "readinessProbe": {
+            "httpGet": {"path": "/ready", "port": 8080, "scheme": "HTTP"},
+            "periodSeconds": 5,
+            "timeoutSeconds": 1,
+            "successThreshold": 1,
+            "failureThreshold": 3
+        },
+        "volumeMounts": [{"name": "config", "mountPath": "/etc/config", "readOnly": True}],
+        "terminationMessagePath": "/dev/termination-log",
+        "terminationMessagePolicy": "File"
+    }
+
+def build_deployment(index):
+    name = f"service-{index}"
+    namespace = f"team-{index % 300}"
+    labels = {"app": name, "team": namespace, "tier": "backend", "version": f"1.{index % 40}.0"}
+    return {
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "uid": f"00000000-0000-0000-0000-{index:012d}",
+            "resourceVersion": str(100000 + index),
+            "generation": 3,
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": labels,
+            "annotations": {
+                "deployment.kubernetes.io/revision": "3",
+                "kubectl.kubernetes.io/last-applied-configuration": json.dumps({"metadata": {"name": name, "labels": labels}}) * 4
+            },
+            "managedFields": [{
+                "manager": "kubectl-client-side-apply",
+                "operation": "Update",
+                "apiVersion": "apps/v1",
+                "time": "2024-01-01T00:00:00Z",
+                "fieldsType": "FieldsV1",
+                "fieldsV1": {"f:metadata": {"f:labels": {f"f:{key}": {} for key in labels}}}
+            }]
+        },
+        "spec": {
+            "replicas": 2,
+            "selector": {"matchLabels": {"app": name}},
+            "strategy": {"type": "RollingUpdate", "rollingUpdate": {"maxUnavailable": "25%", "maxSurge": "25%"}},
+            "revisionHistoryLimit": 10,
+            "progressDeadlineSeconds": 600,
+            "template": {
+                "metadata": {"labels": labels},
+                "spec": {
+                    "containers": [
+                        build_container("app", f"registry.example.com/{namespace}/{name}:1.{index % 40}.0", index),
+                        build_container("proxy", "docker.io/envoyproxy/envoy:v1.29.1", index)
+                    ],
+                    "initContainers": [
+                        build_container("migrate", f"registry.example.com/{namespace}/{name}-migrate:1.{index % 40}.0", index)
+                    ],
+                    "volumes": [{"name": "config", "configMap": {"name": f"{name}-config", "defaultMode": 420}}],
+                    "restartPolicy": "Always",
+                    "terminationGracePeriodSeconds": 30,
+                    "dnsPolicy": "ClusterFirst",
+                    "schedulerName": "default-scheduler",
+                    "securityContext": {}
+                }
+            }
+        },
+        "status": {
+            "observedGeneration": 3,
+            "replicas": 2,
+            "updatedReplicas": 2,
+            "readyReplicas": 2,
+            "availableReplicas": 2,
+            "conditions": [{
+                "type": "Available",
+                "status": "True",
+                "lastUpdateTime": "2024-01-01T00:00:00Z",
+                "lastTransitionTime": "2024-01-01T00:00:00Z",
+                "reason": "MinimumReplicasAvailable",
+                "message": "Deployment has minimum availability."
+            }]
+        }
+    }
+
+def build_apps_client(payload):
+    configuration = client.Configuration()
+    configuration.host = "https://benchmark.invalid"
+    api_client = client.ApiClient(configuration)
+
+    def request(method, url, **kwargs):
+        return urllib3.HTTPResponse(
+            body=BytesIO(payload),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=False
+        )
+
+    api_client.rest_client.pool_manager.request = request
+    return client.AppsV1Api(api_client)
+
+def measure(fetch_mode, apps_v1, rounds):
+    aks.DEPLOYMENT_FETCH_MODE = fetch_mode
+    clients = {"apps_v1": apps_v1}
+    cpu_times = []
+    peak_bytes = 0
+
+    for _ in range(rounds):
+        tracemalloc.start()
+        started = time.process_time()
+        deployments = [info for page in aks.iter_cluster_deployment_pages(clients, "benchmark") for info in page]
+        cpu_times.append(time.process_time() - started)
+        peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        "deployments": len(deployments),
+        "cpu_seconds": min(cpu_times),
+        "peak_mib": peak_bytes / (1024 * 1024)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare CPU and memory of deployment list fetch modes")
+    parser.add_argument("--deployments", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = json.dumps({
+        "kind": "DeploymentList",
+        "apiVersion": "apps/v1",
+        "metadata": {"resourceVersion": "123456"},
+        "items": [build_deployment(index) for index in range(args.deployments)]
+    }).encode()
+    apps_v1 = build_apps_client(payload)
+    aks.DEPLOYMENT_PAGE_SIZE = args.deployments
+
+    print(f"payload: {args.deployments} deployments, {len(payload) / (1024 * 1024):.1f} MiB")
+    for fetch_mode in ("model", "raw"):
+        result = measure(fetch_mode, apps_v1, args.rounds)
+        print(f"{fetch_mode:>6}: {result['deployments']} deployments, cpu {result['cpu_seconds']:.3f}s, peak {result['peak_mib']:.1f} MiB")
+
+if __name__ == "__main__":
+    main()
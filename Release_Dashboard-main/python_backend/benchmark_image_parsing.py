@@ -0,0 +1,91 @@
+import argparse
+import random
+import re
+import time
+
+import aks
+
+LEGACY_VERSION_PATTERN = re.compile(r':([^:@]+)(?:@sha256:.+)?$')
+
+REGISTRIES = [
+    None,
+    "docker.io",
+    "ghcr.io",
+    "quay.io",
+    "mcr.microsoft.com",
+    "pecogniwide.azurecr.io",
+    "registry.internal:5000"
+]
+
+SIDECARS = [
+    "docker.io/envoyproxy/envoy:v1.29.1",
+    "istio/proxyv2:1.20.3",
+    "fluent/fluent-bit:2.2.2",
+    "mcr.microsoft.com/oss/kubernetes/pause:3.6",
+    "busybox:1.36",
+    "curlimages/curl:8.6.0"
+]
+
+def legacy_parse(image_string):
+    match = LEGACY_VERSION_PATTERN.search(image_string)
+    version = match.group(1) if match else "None"
+    repository = image_string.split("@", 1)[0]
+    if repository.rfind(":") > repository.rfind("/"):
+        repository = repository.rsplit(":", 1)[0]
+    return repository, version
+
+def build_corpus(size, services, seed):
+    rng = random.Random(seed)
+    images = []
+    for index in range(services):
+        registry = rng.choice(REGISTRIES)
+        repository = f"team-{index % 40}/service-{index}"
+        if registry:
+            repository = f"{registry}/{repository}"
+        tags = [f"1.{minor}.{patch}" for minor in range(rng.randint(1, 4)) for patch in range(rng.randint(1, 3))]
+        for tag in tags:
+            images.append(f"{repository}:{tag}")
+        if rng.random() < 0.1:
+            images.append(f"{repository}:{tags[-1]}@sha256:{rng.getrandbits(256):064x}")
+    images.extend(SIDECARS)
+
+    weights = [1.0 / (rank + 1) for rank in range(len(images))]
+    return rng.choices(images, weights=weights, k=size)
+
+def timed(function, rounds):
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-container regex parsing with memoized bulk image parsing")
+    parser.add_argument("--images", type=int, default=50000)
+    parser.add_argument("--services", type=int, default=1500)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.images, args.services, args.seed)
+    print(f"corpus: {len(corpus)} image references, {len(set(corpus))} distinct")
+
+    def cold():
+        aks.parse_image_reference.cache_clear()
+        aks.get_container_image.cache_clear()
+        aks.get_container_images(corpus)
+
+    results = [
+        ("legacy", timed(lambda: [legacy_parse(image) for image in corpus], args.rounds)),
+        ("cold", timed(cold, args.rounds)),
+        ("warm", timed(lambda: aks.get_container_images(corpus), args.rounds))
+    ]
+    for name, seconds in results:
+        print(f"{name:>6}: {seconds * 1000:.1f} ms, {seconds * 1e9 / len(corpus):.0f} ns/image")
+
+    mismatches = [image for image in set(corpus) if legacy_parse(image) != (aks.extract_repository_from_image(image), aks.extract_version_from_image(image))]
+    print(f"legacy mismatches: {len(mismatches)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+wsgi_app = "aks:app"
+
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 16))
+preload_app = True
+
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 60))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+
+def post_fork(server, worker):
+    import aks
+    for env in aks.CLUSTERS:
+        aks.initialize_k8s_clients(env)
+    aks.start_cache_warmers()
+
+def worker_exit(server, worker):
+    import aks
+    aks.shutdown_backend()